@@ -0,0 +1,41 @@
+"""Single probe point for the optional Rust extension.
+
+Every package that dispatches between debot_rust and a pure-Python
+fallback resolves through here, so the (possibly failing) extension
+import happens once per process instead of once per package.
+
+Resolution happens at import time — the dispatching packages bind the
+resolved classes into their module globals — so patching this module
+afterwards has no effect. To force the Python fallbacks set
+``DEBOT_PURE_PYTHON=1`` in the environment before importing debot.
+"""
+
+import importlib
+import os
+
+_backend = None
+HAS_RUST = False
+
+if not os.environ.get("DEBOT_PURE_PYTHON"):
+    try:
+        import debot_rust as _backend
+
+        HAS_RUST = True
+        # Spin up the shared Tokio runtime now so the cost lands on the
+        # first Rust touch instead of the first publish or cron tick.
+        _backend._runtime_handle()
+    except ImportError:
+        _backend = None
+        HAS_RUST = False
+
+
+def resolve(name: str, py_module: str):
+    """Return `name` from debot_rust when present, else from `py_module`."""
+    if _backend is not None and hasattr(_backend, name):
+        return getattr(_backend, name)
+    return getattr(importlib.import_module(py_module), name)
+
+
+def rust_module():
+    """The loaded debot_rust module, or None without the extension."""
+    return _backend
@@ -1,8 +1,10 @@
 """Memory system for persistent agent memory."""
 
+import asyncio
 import hashlib
 import json
 import math
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -19,44 +21,138 @@ class MemoryStore:
     """
 
     def __init__(self, workspace: Path):
-        self.workspace = workspace
-        self.memory_dir = ensure_dir(workspace / "memory")
-        self.memory_file = self.memory_dir / "MEMORY.md"
+        self._workspace = workspace
+        self._memory_dir = ensure_dir(workspace / "memory")
+        self._memory_file = self._memory_dir / "MEMORY.md"
+        self._today_cache: tuple[str, Path] | None = None
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def workspace(self) -> str:
+        """Workspace path (string, matching the Rust extension)."""
+        return str(self._workspace)
+
+    @property
+    def memory_dir(self) -> str:
+        """Memory directory path (string, matching the Rust extension)."""
+        return str(self._memory_dir)
+
+    @property
+    def memory_file(self) -> str:
+        """Long-term memory file path (string, matching the Rust extension)."""
+        return str(self._memory_file)
+
+    # Flush buffered appends once they exceed this many bytes.
+    _FLUSH_BYTES = 8192
+
+    # Upper bound on how long a buffered note may wait before hitting disk.
+    _FLUSH_DELAY = 0.05
+
+    def _today_path(self) -> Path:
+        """Today's memory file path, recomputed only when the day rolls over.
+
+        Keyed on the local date string so the rollover matches the filename;
+        a UTC-based day number would point at yesterday's file for part of
+        the day in any non-UTC timezone.
+        """
+        day = today_date()
+        if self._today_cache is None or self._today_cache[0] != day:
+            if self._today_cache is not None and self._pending:
+                # Day rolled over with notes still buffered: they belong
+                # to the previous day's file.
+                self._write_pending(self._today_cache[1])
+            self._today_cache = (day, self._memory_dir / f"{day}.md")
+        return self._today_cache[1]
+
+    def _write_pending(self, path: Path) -> None:
+        """Write all buffered appends to `path` with a single syscall."""
+        if not self._pending:
+            return
+        parts = []
+        if not path.exists():
+            # Add header for new day (the filename stem is the date)
+            parts.append(f"# {path.stem}\n\n{self._pending[0]}")
+            rest = self._pending[1:]
+        else:
+            rest = self._pending
+        parts.extend("\n" + chunk for chunk in rest)
 
-    def get_today_file(self) -> Path:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, "".join(parts).encode("utf-8"))
+        finally:
+            os.close(fd)
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    def flush(self) -> None:
+        """Flush buffered appends to today's file."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._write_pending(self._today_path())
+
+    def _schedule_flush(self) -> None:
+        """Arm a deferred flush so buffered notes reach disk within `_FLUSH_DELAY`.
+
+        Without a running event loop there is nothing to defer to, so the
+        buffer is flushed immediately rather than risk losing the note on
+        process exit.
+        """
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(self._FLUSH_DELAY, self._deferred_flush)
+
+    def _deferred_flush(self) -> None:
+        self._flush_handle = None
+        self.flush()
+
+    def get_today_file(self) -> str:
         """Get path to today's memory file."""
-        return self.memory_dir / f"{today_date()}.md"
+        return str(self._today_path())
 
     def read_today(self) -> str:
         """Read today's memory notes."""
-        today_file = self.get_today_file()
+        self.flush()
+        today_file = self._today_path()
         if today_file.exists():
             return today_file.read_text(encoding="utf-8")
         return ""
 
     def append_today(self, content: str) -> None:
-        """Append content to today's memory notes."""
-        today_file = self.get_today_file()
-
-        if today_file.exists():
-            existing = today_file.read_text(encoding="utf-8")
-            content = existing + "\n" + content
+        """
+        Append content to today's memory notes.
+
+        Appends are buffered and written with one O_APPEND syscall per
+        flush instead of a read/rewrite of the whole file per note; any
+        read path flushes first, so callers never observe stale content.
+        A small buffer is flushed after at most `_FLUSH_DELAY` seconds,
+        so notes are durable shortly after the call even if nothing ever
+        reads them back.
+        """
+        self._pending.append(content)
+        self._pending_bytes += len(content)
+        if self._pending_bytes >= self._FLUSH_BYTES:
+            self.flush()
         else:
-            # Add header for new day
-            header = f"# {today_date()}\n\n"
-            content = header + content
-
-        today_file.write_text(content, encoding="utf-8")
+            self._schedule_flush()
 
     def read_long_term(self) -> str:
         """Read long-term memory (MEMORY.md)."""
-        if self.memory_file.exists():
-            return self.memory_file.read_text(encoding="utf-8")
+        if self._memory_file.exists():
+            return self._memory_file.read_text(encoding="utf-8")
         return ""
 
     def write_long_term(self, content: str) -> None:
         """Write to long-term memory (MEMORY.md)."""
-        self.memory_file.write_text(content, encoding="utf-8")
+        self._memory_file.write_text(content, encoding="utf-8")
 
     def get_recent_memories(self, days: int = 7) -> str:
         """
@@ -70,13 +166,14 @@ class MemoryStore:
         """
         from datetime import timedelta
 
+        self.flush()
         memories = []
         today = datetime.now().date()
 
         for i in range(days):
             date = today - timedelta(days=i)
             date_str = date.strftime("%Y-%m-%d")
-            file_path = self.memory_dir / f"{date_str}.md"
+            file_path = self._memory_dir / f"{date_str}.md"
 
             if file_path.exists():
                 content = file_path.read_text(encoding="utf-8")
@@ -84,13 +181,24 @@ class MemoryStore:
 
         return "\n\n---\n\n".join(memories)
 
-    def list_memory_files(self) -> list[Path]:
+    def list_memory_files(self) -> list[str]:
         """List all memory files sorted by date (newest first)."""
-        if not self.memory_dir.exists():
+        if not self._memory_dir.exists():
             return []
 
-        files = list(self.memory_dir.glob("????-??-??.md"))
-        return sorted(files, reverse=True)
+        # scandir's dirents carry the file type on Linux, so is_file() with
+        # follow_symlinks=False avoids a stat call per entry.
+        memory_dir = str(self._memory_dir)
+        with os.scandir(memory_dir) as it:
+            names = [
+                e.name
+                for e in it
+                if _is_date_filename(e.name) and e.is_file(follow_symlinks=False)
+            ]
+        # ISO date filenames sort lexicographically, so a reverse name
+        # sort is newest-first without parsing any dates.
+        names.sort(reverse=True)
+        return [os.path.join(memory_dir, n) for n in names]
 
     def get_memory_context(self) -> str:
         """
@@ -114,56 +222,64 @@ class MemoryStore:
         return "\n\n".join(parts) if parts else ""
 
     def build_index(self) -> int:
-        """Build a simple local index for all markdown memory files.
+        """Build or refresh the local index for all markdown memory files.
 
-        Returns the number of indexed chunks written to `.index.json`.
+        The index is keyed per file with its mtime and size, so unchanged
+        files keep their chunks from the previous build and only new or
+        modified files are re-embedded. Returns the total chunk count
+        written to `.index.json`.
         """
-        entries: List[Dict] = []
-
-        if not self.memory_dir.exists():
+        if not self._memory_dir.exists():
             return 0
 
-        for entry in self.memory_dir.iterdir():
-            path = entry
+        self.flush()
+        index_path = self._memory_dir / ".index.json"
+        old_files: Dict[str, Dict] = {}
+        if index_path.exists():
+            try:
+                loaded = json.loads(index_path.read_text(encoding="utf-8"))
+                old_files = loaded.get("files", {})
+            except Exception:
+                old_files = {}
+
+        files: Dict[str, Dict] = {}
+        for path in self._memory_dir.iterdir():
             if not path.is_file() or not path.name.endswith(".md"):
                 continue
-            text = path.read_text(encoding="utf-8")
-            chunk_size = 800
-            overlap = 100
-            start = 0
-            length = len(text)
-            while start < length:
-                end = min(start + chunk_size, length)
-                chunk = text[start:end]
-                vec = _embed_local(chunk)
-                entry_obj = {
-                    "id": str(uuid.uuid4()),
-                    "path": str(path.relative_to(self.workspace)),
-                    "start_line": 0,
-                    "end_line": 0,
-                    "text": chunk,
-                    "vector": vec,
-                }
-                entries.append(entry_obj)
-                if end == length:
-                    break
-                start = max(0, end - overlap)
-
-        index_path = self.memory_dir / ".index.json"
-        index_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
-        return len(entries)
+            rel = str(path.relative_to(self._workspace))
+            stat = path.stat()
+            cached = old_files.get(rel)
+            if (
+                cached
+                and cached.get("mtime_ns") == stat.st_mtime_ns
+                and cached.get("size") == stat.st_size
+            ):
+                files[rel] = cached
+                continue
+            files[rel] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "entries": _chunk_and_embed(path.read_text(encoding="utf-8"), rel),
+            }
+
+        # Atomic rename so a crash mid-write never leaves a torn index.
+        tmp_path = index_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps({"files": files}, indent=2), encoding="utf-8")
+        tmp_path.replace(index_path)
+        return sum(len(f["entries"]) for f in files.values())
 
     def search(self, query: str, max_results: int = 5, min_score: float = 0.0) -> List[Dict]:
         """Search the local index for semantically similar chunks.
 
         Returns a list of dicts: {path, snippet, score}.
         """
-        index_path = self.memory_dir / ".index.json"
+        index_path = self._memory_dir / ".index.json"
         if not index_path.exists():
             return []
 
         try:
-            entries = json.loads(index_path.read_text(encoding="utf-8"))
+            loaded = json.loads(index_path.read_text(encoding="utf-8"))
+            entries = [e for f in loaded.get("files", {}).values() for e in f["entries"]]
         except Exception:
             return []
 
@@ -184,10 +300,49 @@ class MemoryStore:
         return results
 
 
+def _is_date_filename(name: str) -> bool:
+    """Match YYYY-MM-DD.md with direct byte checks; no regex machinery."""
+    return (
+        len(name) == 13
+        and name[4] == "-"
+        and name[7] == "-"
+        and name.endswith(".md")
+        and name[:4].isdigit()
+        and name[5:7].isdigit()
+        and name[8:10].isdigit()
+    )
+
+
+def _chunk_and_embed(text: str, rel_path: str) -> List[Dict]:
+    """Split file text into overlapping chunks and embed each one."""
+    chunk_size = 800
+    overlap = 100
+    entries: List[Dict] = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(start + chunk_size, length)
+        chunk = text[start:end]
+        entries.append(
+            {
+                "id": str(uuid.uuid4()),
+                "path": rel_path,
+                "start_line": 0,
+                "end_line": 0,
+                "text": chunk,
+                "vector": _embed_local(chunk),
+            }
+        )
+        if end == length:
+            break
+        start = max(0, end - overlap)
+    return entries
+
+
 def _embed_local(text: str) -> List[float]:
     h = hashlib.sha256(text.encode("utf-8")).digest()
     dims = 64
-    vec = [(b / 127.5) - 1.0 for i, b in enumerate(h * (dims // len(h) + 1))[:dims]]
+    vec = [(b / 127.5) - 1.0 for b in (h * (dims // len(h) + 1))[:dims]]
     norm = math.sqrt(sum(x * x for x in vec))
     if norm < 1e-6:
         norm = 1e-6
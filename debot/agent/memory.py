@@ -1,9 +1,8 @@
 """Memory system module - Rust implementation with Python fallback."""
 
-try:
-    from debot_rust import MemoryStore
-except ImportError:
-    from debot.agent._memory_py import MemoryStore
+from debot._backend import resolve
+
+MemoryStore = resolve("MemoryStore", "debot.agent._memory_py")
 
 __all__ = ["MemoryStore"]
 
@@ -1,5 +1,7 @@
 """File system tools: read, write, edit."""
 
+import hashlib
+import mmap
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +27,10 @@ class ReadFileTool(Tool):
             "required": ["path"],
         }
 
+    # Files at or above this size are read through an mmap instead of a
+    # buffered read, skipping the kernel-to-userspace copy.
+    _MMAP_THRESHOLD = 64 * 1024
+
     async def execute(self, path: str, **kwargs: Any) -> str:
         try:
             file_path = Path(path).expanduser()
@@ -33,8 +39,12 @@ class ReadFileTool(Tool):
             if not file_path.is_file():
                 return f"Error: Not a file: {path}"
 
-            content = file_path.read_text(encoding="utf-8")
-            return content
+            if file_path.stat().st_size >= self._MMAP_THRESHOLD:
+                with open(file_path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        return m[:].decode("utf-8")
+
+            return file_path.read_text(encoding="utf-8")
         except PermissionError:
             return f"Error: Permission denied: {path}"
         except Exception as e:
@@ -66,8 +76,14 @@ class WriteFileTool(Tool):
     async def execute(self, path: str, content: str, **kwargs: Any) -> str:
         try:
             file_path = Path(path).expanduser()
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding="utf-8")
+            encoded = content.encode("utf-8")
+            # Optimistic write: the parent usually exists, so only pay
+            # the mkdir walk after an ENOENT.
+            try:
+                file_path.write_bytes(encoded)
+            except FileNotFoundError:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_bytes(encoded)
             return f"Successfully wrote {len(content)} bytes to {path}"
         except PermissionError:
             return f"Error: Permission denied: {path}"
@@ -106,18 +122,24 @@ class EditFileTool(Tool):
 
             content = file_path.read_text(encoding="utf-8")
 
-            if old_text not in content:
+            # Locate the first match, then count from there; no separate
+            # membership scan before the count.
+            first = content.find(old_text)
+            if first == -1:
                 return "Error: old_text not found in file. Make sure it matches exactly."
 
-            # Count occurrences
-            count = content.count(old_text)
+            count = content.count(old_text, first)
             if count > 1:
                 return f"Warning: old_text appears {count} times. Please provide more context to make it unique."
 
-            new_content = content.replace(old_text, new_text, 1)
-            file_path.write_text(new_content, encoding="utf-8")
+            new_content = content[:first] + new_text + content[first + len(old_text) :]
+            encoded = new_content.encode("utf-8")
+            file_path.write_bytes(encoded)
 
-            return f"Successfully edited {path}"
+            # Report size and digest of the buffer we just wrote, so
+            # callers can verify the edit without re-reading the file.
+            digest = hashlib.sha256(encoded).hexdigest()
+            return f"Successfully edited {path} ({len(encoded)} bytes, sha256={digest})"
         except PermissionError:
             return f"Error: Permission denied: {path}"
         except Exception as e:
@@ -14,14 +14,29 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        # Definitions built on first get_definitions call; dropped when
+        # the registered set changes.
+        self._cached_defs: list[dict[str, Any]] | None = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._cached_defs = None
 
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
         self._tools.pop(name, None)
+        self._cached_defs = None
+
+    def clone_shallow(self) -> "ToolRegistry":
+        """Copy of the registry sharing the same tool instances.
+
+        Cheap to fork from a prebuilt registry: register/unregister on
+        the clone never touches the original.
+        """
+        clone = ToolRegistry()
+        clone._tools = dict(self._tools)
+        return clone
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -32,7 +47,14 @@ class ToolRegistry:
         return name in self._tools
 
     def get_definitions(self) -> list[dict[str, Any]]:
-        """Get all tool definitions in OpenAI format."""
+        """Get all tool definitions in OpenAI format.
+
+        Served from a cache until register/unregister changes the tool
+        set, so callers that resend schemas every turn pay nothing.
+        """
+        if self._cached_defs is not None:
+            return self._cached_defs
+
         definitions = []
         for tool in self._tools.values():
             # Build schema from properties (works for both Python and Rust tools)
@@ -46,6 +68,7 @@ class ToolRegistry:
                     },
                 }
             )
+        self._cached_defs = definitions
         return definitions
 
     async def execute(self, name: str, params: dict[str, Any]) -> str:
@@ -1,7 +1,6 @@
 """Shell execution tool."""
 
 import asyncio
-import os
 from typing import Any
 
 from debot.agent.tools._base_py import Tool
@@ -37,7 +36,9 @@ class ExecTool(Tool):
         }
 
     async def execute(self, command: str, working_dir: str | None = None, **kwargs: Any) -> str:
-        cwd = working_dir or self.working_dir or os.getcwd()
+        # None lets the child inherit our cwd without an explicit chdir,
+        # keeping the spawn on the vfork/posix_spawn fast path.
+        cwd = working_dir or self.working_dir
 
         try:
             process = await asyncio.create_subprocess_shell(
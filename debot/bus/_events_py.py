@@ -1,11 +1,20 @@
 """Event types for the message bus."""
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import time
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
+try:
+    import msgspec
 
-@dataclass
+    _HAS_MSGSPEC = True
+except ImportError:
+    import json
+
+    _HAS_MSGSPEC = False
+
+
+@dataclass(slots=True)
 class InboundMessage:
     """Message received from a chat channel."""
 
@@ -13,7 +22,7 @@ class InboundMessage:
     sender_id: str  # User identifier
     chat_id: str  # Chat/channel identifier
     content: str  # Message text
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Unix epoch seconds
     media: list[str] = field(default_factory=list)  # Media URLs
     metadata: dict[str, Any] = field(default_factory=dict)  # Channel-specific data
 
@@ -22,8 +31,30 @@ class InboundMessage:
         """Unique key for session identification."""
         return f"{self.channel}:{self.chat_id}"
 
+    @classmethod
+    def parse(cls, raw: dict[str, Any]) -> "InboundMessage":
+        """
+        Validate and build a message from an external payload.
+
+        Transports call this once at ingress; internal code constructs
+        messages directly and skips the checks.
+        """
+        for key in ("channel", "sender_id", "chat_id", "content"):
+            value = raw.get(key)
+            if not isinstance(value, str):
+                raise ValueError(f"InboundMessage field '{key}' must be a string")
+        return cls(
+            channel=raw["channel"],
+            sender_id=raw["sender_id"],
+            chat_id=raw["chat_id"],
+            content=raw["content"],
+            timestamp=float(raw.get("timestamp", time.time())),
+            media=list(raw.get("media") or []),
+            metadata=dict(raw.get("metadata") or {}),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class OutboundMessage:
     """Message to send to a chat channel."""
 
@@ -33,3 +64,37 @@ class OutboundMessage:
     reply_to: str | None = None
     media: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+
+
+if _HAS_MSGSPEC:
+    # msgspec encodes/decodes slotted dataclasses natively and skips the
+    # intermediate dict round-trip that json.dumps(asdict(...)) pays.
+    _ENC = msgspec.json.Encoder()
+    _INBOUND_DEC = msgspec.json.Decoder(InboundMessage)
+    _OUTBOUND_DEC = msgspec.json.Decoder(OutboundMessage)
+
+    def encode_message(msg: "InboundMessage | OutboundMessage") -> bytes:
+        """Serialize a bus message to JSON bytes for the wire."""
+        return _ENC.encode(msg)
+
+    def decode_inbound(buf: bytes | str) -> InboundMessage:
+        """Deserialize and validate an inbound message from JSON bytes."""
+        return _INBOUND_DEC.decode(buf)
+
+    def decode_outbound(buf: bytes | str) -> OutboundMessage:
+        """Deserialize and validate an outbound message from JSON bytes."""
+        return _OUTBOUND_DEC.decode(buf)
+
+else:
+
+    def encode_message(msg: "InboundMessage | OutboundMessage") -> bytes:
+        """Serialize a bus message to JSON bytes for the wire."""
+        return json.dumps(asdict(msg)).encode()
+
+    def decode_inbound(buf: bytes | str) -> InboundMessage:
+        """Deserialize and validate an inbound message from JSON bytes."""
+        return InboundMessage.parse(json.loads(buf))
+
+    def decode_outbound(buf: bytes | str) -> OutboundMessage:
+        """Deserialize an outbound message from JSON bytes."""
+        return OutboundMessage(**json.loads(buf))
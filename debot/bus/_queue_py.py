@@ -1,12 +1,81 @@
 """Async message queue for decoupled channel-agent communication."""
 
 import asyncio
-from typing import Awaitable, Callable
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Generic, TypeVar
 
 from loguru import logger
 
 from debot.bus._events_py import InboundMessage, OutboundMessage
 
+T = TypeVar("T")
+
+# Default ring capacity; generous for a personal assistant workload where
+# backlogs beyond a few thousand pending messages indicate a stuck consumer.
+DEFAULT_CAPACITY = 4096
+
+
+class _Ring(Generic[T]):
+    """
+    Fixed-capacity MPSC ring buffer with a single-event consumer wakeup.
+
+    Producers must run on the consumer's event loop (all in-tree producers
+    do — ``asyncio.Event.set()`` from a foreign thread would not reliably
+    wake the loop); the single consumer is wait-free when messages are
+    pending and parks on one shared ``asyncio.Event`` otherwise. This
+    avoids the per-op Future allocation and lock/wakeup dance of
+    ``asyncio.Queue`` on the hot FIFO path.
+
+    On overflow the oldest pending message is dropped with a warning; a
+    backlog at capacity means the consumer is stuck, not that the
+    producer should block.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._items: deque[T] = deque(maxlen=capacity)
+        self._ready = asyncio.Event()
+        self._lock = threading.Lock()
+
+    def push(self, item: T) -> None:
+        """Append an item and wake the consumer (no await, no Future)."""
+        with self._lock:
+            if len(self._items) == self._items.maxlen:
+                logger.warning(
+                    f"Message ring full ({self._items.maxlen} items); dropping oldest message"
+                )
+            self._items.append(item)
+            self._ready.set()
+
+    def push_many(self, items: "list[T]") -> None:
+        """Append a batch of items with a single consumer wakeup."""
+        if not items:
+            return
+        with self._lock:
+            overflow = len(self._items) + len(items) - (self._items.maxlen or 0)
+            if overflow > 0:
+                logger.warning(
+                    f"Message ring full ({self._items.maxlen} items); "
+                    f"dropping {overflow} oldest message(s)"
+                )
+            self._items.extend(items)
+            self._ready.set()
+
+    async def pop(self) -> T:
+        """Pop the next item, parking on the wakeup event when empty."""
+        while not self._items:
+            self._ready.clear()
+            if self._items:  # producer raced between check and clear
+                break
+            await self._ready.wait()
+        item = self._items.popleft()
+        if not self._items:
+            self._ready.clear()
+        return item
+
+    def __len__(self) -> int:
+        return len(self._items)
+
 
 class MessageBus:
     """
@@ -17,8 +86,8 @@ class MessageBus:
     """
 
     def __init__(self):
-        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
-        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
+        self.inbound: _Ring[InboundMessage] = _Ring()
+        self.outbound: _Ring[OutboundMessage] = _Ring()
         self._outbound_subscribers: dict[
             str, list[Callable[[OutboundMessage], Awaitable[None]]]
         ] = {}
@@ -26,19 +95,28 @@ class MessageBus:
 
     async def publish_inbound(self, msg: InboundMessage) -> None:
         """Publish a message from a channel to the agent."""
-        await self.inbound.put(msg)
+        self.inbound.push(msg)
+
+    async def publish_inbound_many(self, msgs: list[InboundMessage]) -> None:
+        """
+        Publish a burst of messages with one coalesced wakeup.
+
+        Amortizes the event set/clear cost across the batch; FIFO order
+        is preserved.
+        """
+        self.inbound.push_many(msgs)
 
     async def consume_inbound(self) -> InboundMessage:
         """Consume the next inbound message (blocks until available)."""
-        return await self.inbound.get()
+        return await self.inbound.pop()
 
     async def publish_outbound(self, msg: OutboundMessage) -> None:
         """Publish a response from the agent to channels."""
-        await self.outbound.put(msg)
+        self.outbound.push(msg)
 
     async def consume_outbound(self) -> OutboundMessage:
         """Consume the next outbound message (blocks until available)."""
-        return await self.outbound.get()
+        return await self.outbound.pop()
 
     def subscribe_outbound(
         self, channel: str, callback: Callable[[OutboundMessage], Awaitable[None]]
@@ -56,7 +134,7 @@ class MessageBus:
         self._running = True
         while self._running:
             try:
-                msg = await asyncio.wait_for(self.outbound.get(), timeout=1.0)
+                msg = await asyncio.wait_for(self.outbound.pop(), timeout=1.0)
                 subscribers = self._outbound_subscribers.get(msg.channel, [])
                 for callback in subscribers:
                     try:
@@ -73,9 +151,9 @@ class MessageBus:
     @property
     def inbound_size(self) -> int:
         """Number of pending inbound messages."""
-        return self.inbound.qsize()
+        return len(self.inbound)
 
     @property
     def outbound_size(self) -> int:
         """Number of pending outbound messages."""
-        return self.outbound.qsize()
+        return len(self.outbound)
@@ -284,7 +284,7 @@ def gateway(
 ):
     """Start the debot gateway."""
     from debot.agent.loop import AgentLoop
-    from debot.bus import MessageBus
+    from debot.bus import MessageBus, install_fast_loop
     from debot.channels.manager import ChannelManager
     from debot.config.loader import get_data_dir, load_config
     from debot.cron import CronJob, CronService
@@ -391,6 +391,9 @@ def gateway(
             agent.stop()
             await channels.stop_all()
 
+    # uvloop (if installed) speeds up the fallback bus's wakeup path
+    install_fast_loop()
+
     asyncio.run(run())
 
 
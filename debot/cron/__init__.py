@@ -1,9 +1,22 @@
 """Cron service for scheduled agent tasks."""
 
-try:
-    from debot_rust import CronJob, CronSchedule, CronService
-except ImportError:
-    from debot.cron._service_py import CronService
-    from debot.cron._types_py import CronJob, CronSchedule
-
 __all__ = ["CronService", "CronJob", "CronSchedule"]
+
+# Fallback module for each public name if the Rust extension is absent.
+_FALLBACKS = {
+    "CronService": "debot.cron._service_py",
+    "CronJob": "debot.cron._types_py",
+    "CronSchedule": "debot.cron._types_py",
+}
+
+
+def __getattr__(name):
+    # PEP 562 lazy resolution: the compiled extension is only loaded when
+    # a cron class is actually requested, keeping pure-Python imports flat.
+    if name in _FALLBACKS:
+        from debot._backend import resolve
+
+        val = resolve(name, _FALLBACKS[name])
+        globals()[name] = val
+        return val
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,15 @@
 """Heartbeat service for periodic agent wake-ups."""
 
-try:
-    from debot_rust import HeartbeatService
-except ImportError:
-    from debot.heartbeat._service_py import HeartbeatService
-
 __all__ = ["HeartbeatService"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy resolution: the compiled extension is only loaded when
+    # the service class is actually requested.
+    if name == "HeartbeatService":
+        from debot._backend import resolve
+
+        val = resolve(name, "debot.heartbeat._service_py")
+        globals()[name] = val
+        return val
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,8 @@
 """Session management module - Rust implementation with Python fallback."""
 
-try:
-    from debot_rust import Session, SessionManager
-except ImportError:
-    from debot.session._manager_py import Session, SessionManager
+from debot._backend import resolve
+
+Session = resolve("Session", "debot.session._manager_py")
+SessionManager = resolve("SessionManager", "debot.session._manager_py")
 
 __all__ = ["SessionManager", "Session"]
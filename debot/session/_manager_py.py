@@ -1,6 +1,7 @@
 """Session management for conversation history."""
 
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +32,20 @@ class Session:
         self.messages.append(msg)
         self.updated_at = datetime.now()
 
+    def add_messages(self, messages: list[dict[str, Any]]) -> None:
+        """Add several messages in one call.
+
+        Each dict needs `role` and `content`; a missing `timestamp` is
+        filled with the batch time. `updated_at` is stamped once.
+        """
+        now = datetime.now()
+        stamp = now.isoformat()
+        for msg in messages:
+            if "role" not in msg or "content" not in msg:
+                raise KeyError("message requires 'role' and 'content'")
+            self.messages.append({"timestamp": stamp, **msg})
+        self.updated_at = now
+
     def compact(self, keep_last: int = 50, instruction: str | None = None) -> int:
         """Compact older messages into a single summary entry.
 
@@ -111,12 +126,45 @@ class Session:
         # Convert to LLM format (just role and content)
         return [{"role": m["role"], "content": m["content"]} for m in recent]
 
+    def history_view(self, max_messages: int = 50) -> "HistoryView":
+        """Get a lazy read-only view of the last `max_messages` messages.
+
+        Builds a `{"role", "content"}` dict only for the indices a
+        consumer actually touches, unlike `get_history` which
+        materializes every row up front.
+        """
+        start = max(0, len(self.messages) - max_messages)
+        return HistoryView(self.messages[start:])
+
     def clear(self) -> None:
         """Clear all messages in the session."""
         self.messages = []
         self.updated_at = datetime.now()
 
 
+class HistoryView:
+    """Lazy read-only window over a session's message history.
+
+    Holds a snapshot of the message references taken at creation; later
+    session mutations do not show up here.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        row = self._rows[index]
+        return {"role": row["role"], "content": row["content"]}
+
+    def __repr__(self) -> str:
+        return f"HistoryView(len={len(self._rows)})"
+
+
 class SessionManager:
     """
     Manages conversation sessions.
@@ -124,16 +172,44 @@ class SessionManager:
     Sessions are stored as JSONL files in the sessions directory.
     """
 
+    # Most sessions kept in memory before least-recently-used eviction.
+    _CACHE_CAPACITY = 4096
+
+    # Rewrite the full snapshot once this many lines are appended past it.
+    _COMPACT_THRESHOLD = 256
+
+    # Sidecar mapping file stem -> session info, so list_sessions reads
+    # one file instead of the first line of every session file.
+    _INDEX_FILE = ".sessions_index.json"
+
     def __init__(self, workspace: Path):
         self.workspace = workspace
         self.sessions_dir = ensure_dir(Path.home() / ".debot" / "sessions")
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._index_mtime: int | None = None
+        # Insertion-ordered dict doubles as the LRU: re-inserting on
+        # access moves a key to the "recent" end.
         self._cache: dict[str, Session] = {}
+        self._hits = 0
+        self._misses = 0
+        # key -> (messages persisted, log lines past snapshot, head timestamp,
+        # tail timestamp); tracks what is already on disk so save() can append
+        # only the delta.
+        self._persisted: dict[str, tuple[int, int, str | None, str | None]] = {}
 
     def _get_session_path(self, key: str) -> Path:
         """Get the file path for a session."""
         safe_key = safe_filename(key.replace(":", "_"))
         return self.sessions_dir / f"{safe_key}.jsonl"
 
+    def _cache_put(self, key: str, session: Session) -> None:
+        """Insert into the LRU cache, evicting the oldest entry when full."""
+        self._cache.pop(key, None)
+        if len(self._cache) >= self._CACHE_CAPACITY:
+            oldest = next(iter(self._cache))
+            del self._cache[oldest]
+        self._cache[key] = session
+
     def get_or_create(self, key: str) -> Session:
         """
         Get an existing session or create a new one.
@@ -145,17 +221,30 @@ class SessionManager:
             The session.
         """
         # Check cache
-        if key in self._cache:
-            return self._cache[key]
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            self._hits += 1
+            self._cache[key] = cached  # refresh LRU position
+            return cached
+        self._misses += 1
 
         # Try to load from disk
         session = self._load(key)
         if session is None:
             session = Session(key=key)
 
-        self._cache[key] = session
+        self._cache_put(key, session)
         return session
 
+    def cache_stats(self) -> dict[str, int]:
+        """Cache hit/miss counters and occupancy, for tests and diagnostics."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._cache),
+            "capacity": self._CACHE_CAPACITY,
+        }
+
     def _load(self, key: str) -> Session | None:
         """Load a session from disk."""
         path = self._get_session_path(key)
@@ -196,25 +285,124 @@ class SessionManager:
             logger.warning(f"Failed to load session {key}: {e}")
             return None
 
-    def save(self, session: Session) -> None:
-        """Save a session to disk."""
-        path = self._get_session_path(session.key)
+    def _serialize(self, session: Session) -> str:
+        """Serialize a session to its full JSONL payload (metadata line first)."""
+        metadata_line = {
+            "_type": "metadata",
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata,
+        }
+        lines = [json.dumps(metadata_line)]
+        lines.extend(json.dumps(msg) for msg in session.messages)
+        return "\n".join(lines) + "\n"
 
-        with open(path, "w") as f:
-            # Write metadata first
-            metadata_line = {
+    def _metadata_line(self, session: Session) -> str:
+        return json.dumps(
+            {
                 "_type": "metadata",
                 "created_at": session.created_at.isoformat(),
                 "updated_at": session.updated_at.isoformat(),
                 "metadata": session.metadata,
             }
-            f.write(json.dumps(metadata_line) + "\n")
+        )
+
+    def _head_stamp(self, session: Session, count: int) -> str | None:
+        """Timestamp of the first persisted message.
+
+        `compact()` replaces the head with a freshly stamped summary entry,
+        so a changed head stamp flags a rewrite even when the message count
+        and tail are unchanged (e.g. compacting exactly one message).
+        """
+        if count == 0:
+            return None
+        return session.messages[0].get("timestamp")
+
+    def _tail_stamp(self, session: Session, count: int) -> str | None:
+        """Timestamp of the last persisted message, to detect history rewrites."""
+        if count == 0:
+            return None
+        return session.messages[count - 1].get("timestamp")
+
+    def _snapshot(self, session: Session, path: Path) -> None:
+        """Rewrite the full session file and reset the append log state."""
+        path.write_text(self._serialize(session))
+        n = len(session.messages)
+        self._persisted[session.key] = (
+            n,
+            0,
+            self._head_stamp(session, n),
+            self._tail_stamp(session, n),
+        )
+
+    def save(self, session: Session) -> None:
+        """Save a session to disk.
+
+        New messages are appended to the existing JSONL file (one O_APPEND
+        write per save, cost independent of history length) along with a
+        refreshed metadata line; `_load` takes the last metadata line it
+        sees, so the log stays readable. A full snapshot is rewritten when
+        the history was truncated or edited (clear/compact) or once the
+        appended log grows past `_COMPACT_THRESHOLD` lines.
+        """
+        path = self._get_session_path(session.key)
+        n = len(session.messages)
+        state = self._persisted.get(session.key)
+
+        can_append = (
+            state is not None
+            and path.exists()
+            and state[0] <= n
+            and state[1] < self._COMPACT_THRESHOLD
+            and self._head_stamp(session, state[0]) == state[2]
+            and self._tail_stamp(session, state[0]) == state[3]
+        )
+
+        if not can_append:
+            self._snapshot(session, path)
+        else:
+            done, log_lines, _, _ = state
+            lines = [json.dumps(msg) for msg in session.messages[done:]]
+            lines.append(self._metadata_line(session))
+            payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+
+            self._persisted[session.key] = (
+                n,
+                log_lines + len(lines),
+                self._head_stamp(session, n),
+                self._tail_stamp(session, n),
+            )
+
+        self._index_put(session, path)
+        self._cache_put(session.key, session)
 
-            # Write messages
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
+    def save_many(self, sessions: list[Session]) -> None:
+        """Save several sessions in one call.
 
-        self._cache[session.key] = session
+        All payloads are serialized up front, then written with a single
+        write per file, avoiding per-session call overhead in hot loops.
+        """
+        payloads = [(s, self._serialize(s)) for s in sessions]
+        for session, payload in payloads:
+            path = self._get_session_path(session.key)
+            path.write_text(payload)
+            n = len(session.messages)
+            self._persisted[session.key] = (
+                n,
+                0,
+                self._head_stamp(session, n),
+                self._tail_stamp(session, n),
+            )
+            self._index_put(session, path, persist=False)
+            self._cache_put(session.key, session)
+        if payloads:
+            self._persist_index()
 
     def delete(self, key: str) -> bool:
         """
@@ -226,45 +414,109 @@ class SessionManager:
         Returns:
             True if deleted, False if not found.
         """
-        # Remove from cache
+        # Remove from cache and forget the on-disk log state
         self._cache.pop(key, None)
+        self._persisted.pop(key, None)
 
-        # Remove file
+        # Remove file and its index entry
         path = self._get_session_path(key)
+        index = self._ensure_index()
+        if index.pop(path.stem, None) is not None:
+            self._persist_index()
         if path.exists():
             path.unlink()
             return True
         return False
 
-    def list_sessions(self) -> list[dict[str, Any]]:
-        """
-        List all sessions.
-
-        Returns:
-            List of session info dicts.
-        """
-        sessions = []
+    def _index_path(self) -> Path:
+        return self.sessions_dir / self._INDEX_FILE
 
+    def _scan_index(self) -> dict[str, dict[str, Any]]:
+        """Rebuild the index by reading every session file's metadata line."""
+        index: dict[str, dict[str, Any]] = {}
         for path in self.sessions_dir.glob("*.jsonl"):
             try:
-                # Read just the metadata line
                 with open(path) as f:
                     first_line = f.readline().strip()
-                    if first_line:
-                        data = json.loads(first_line)
-                        if data.get("_type") == "metadata":
-                            sessions.append(
-                                {
-                                    "key": path.stem.replace("_", ":"),
-                                    "created_at": data.get("created_at"),
-                                    "updated_at": data.get("updated_at"),
-                                    "path": str(path),
-                                }
-                            )
+                if not first_line:
+                    continue
+                data = json.loads(first_line)
+                if data.get("_type") == "metadata":
+                    index[path.stem] = {
+                        "key": path.stem.replace("_", ":"),
+                        "created_at": data.get("created_at"),
+                        "updated_at": data.get("updated_at"),
+                        "path": str(path),
+                    }
             except Exception:
                 continue
+        return index
 
-        return sorted(sessions, key=lambda x: x.get("updated_at", ""), reverse=True)
+    def _sidecar_mtime(self) -> int | None:
+        """Current mtime of the index sidecar, or None when it is absent."""
+        try:
+            return os.stat(self._index_path()).st_mtime_ns
+        except OSError:
+            return None
+
+    def _ensure_index(self) -> dict[str, dict[str, Any]]:
+        """Load the index from its sidecar, rebuilding it when absent or torn.
+
+        The sessions directory is shared (e.g. gateway plus a CLI command),
+        so the cached copy is re-read whenever the sidecar's mtime has
+        moved; otherwise a manager holding a stale index would persist it
+        back and erase entries another process wrote.
+        """
+        mtime = self._sidecar_mtime()
+        if self._index is not None and mtime == self._index_mtime:
+            return self._index
+        loaded = None
+        if mtime is not None:
+            try:
+                loaded = json.loads(self._index_path().read_text(encoding="utf-8"))
+            except Exception:
+                loaded = None
+        if loaded is None:
+            self._index = self._scan_index()
+            self._persist_index()
+        else:
+            self._index = loaded
+            self._index_mtime = mtime
+        return self._index
+
+    def _persist_index(self) -> None:
+        """Atomically rewrite the index sidecar (write to tmp, then rename)."""
+        tmp = self._index_path().with_suffix(".json.tmp")
+        try:
+            tmp.write_text(json.dumps(self._index), encoding="utf-8")
+            os.replace(tmp, self._index_path())
+            self._index_mtime = self._sidecar_mtime()
+        except OSError as e:
+            logger.warning(f"Failed to persist session index: {e}")
+
+    def _index_put(self, session: Session, path: Path, persist: bool = True) -> None:
+        index = self._ensure_index()
+        index[path.stem] = {
+            "key": session.key,
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "path": str(path),
+        }
+        if persist:
+            self._persist_index()
+
+    def list_sessions(self) -> list[dict[str, Any]]:
+        """
+        List all sessions.
+
+        Reads the index sidecar in one go instead of opening every
+        session file; the sidecar is rebuilt by scanning when missing.
+
+        Returns:
+            List of session info dicts.
+        """
+        sessions = list(self._ensure_index().values())
+        return sorted(sessions, key=lambda x: x.get("updated_at") or "", reverse=True)
 
     def compact_session(self, key: str, keep_last: int = 50, instruction: str | None = None) -> int:
         """Helper: load-or-create the session, run compaction, save, and return compacted count."""
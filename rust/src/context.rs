@@ -1,6 +1,7 @@
 //! Context builder for assembling agent prompts.
 
 use base64::{engine::general_purpose::STANDARD as BASE64, Engine};
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use std::fs;
@@ -102,8 +103,8 @@ impl ContextBuilder {
         // System prompt
         let system_prompt = self.build_system_prompt(py, skill_names)?;
         let system_msg = PyDict::new(py);
-        system_msg.set_item("role", "system")?;
-        system_msg.set_item("content", system_prompt)?;
+        system_msg.set_item(intern!(py, "role"), "system")?;
+        system_msg.set_item(intern!(py, "content"), system_prompt)?;
         messages.append(system_msg)?;
 
         // History
@@ -114,8 +115,8 @@ impl ContextBuilder {
         // Current message (with optional image attachments)
         let user_content = self.build_user_content(py, current_message, media)?;
         let user_msg = PyDict::new(py);
-        user_msg.set_item("role", "user")?;
-        user_msg.set_item("content", user_content)?;
+        user_msg.set_item(intern!(py, "role"), "user")?;
+        user_msg.set_item(intern!(py, "content"), user_content)?;
         messages.append(user_msg)?;
 
         Ok(messages.into())
@@ -131,10 +132,10 @@ impl ContextBuilder {
         result: &str,
     ) -> PyResult<Py<PyList>> {
         let msg = PyDict::new(py);
-        msg.set_item("role", "tool")?;
-        msg.set_item("tool_call_id", tool_call_id)?;
-        msg.set_item("name", tool_name)?;
-        msg.set_item("content", result)?;
+        msg.set_item(intern!(py, "role"), "tool")?;
+        msg.set_item(intern!(py, "tool_call_id"), tool_call_id)?;
+        msg.set_item(intern!(py, "name"), tool_name)?;
+        msg.set_item(intern!(py, "content"), result)?;
         messages.append(msg)?;
 
         Ok(messages.clone().unbind())
@@ -150,11 +151,11 @@ impl ContextBuilder {
         tool_calls: Option<&Bound<'_, PyList>>,
     ) -> PyResult<Py<PyList>> {
         let msg = PyDict::new(py);
-        msg.set_item("role", "assistant")?;
-        msg.set_item("content", content.unwrap_or(""))?;
+        msg.set_item(intern!(py, "role"), "assistant")?;
+        msg.set_item(intern!(py, "content"), content.unwrap_or(""))?;
 
         if let Some(tc) = tool_calls {
-            msg.set_item("tool_calls", tc)?;
+            msg.set_item(intern!(py, "tool_calls"), tc)?;
         }
 
         messages.append(msg)?;
@@ -255,11 +256,11 @@ When remembering something, write to {}/memory/MEMORY.md"#,
             if let Ok(bytes) = fs::read(&p) {
                 let b64 = BASE64.encode(&bytes);
                 let image_dict = PyDict::new(py);
-                image_dict.set_item("type", "image_url")?;
+                image_dict.set_item(intern!(py, "type"), "image_url")?;
 
                 let url_dict = PyDict::new(py);
-                url_dict.set_item("url", format!("data:{};base64,{}", mime, b64))?;
-                image_dict.set_item("image_url", url_dict)?;
+                url_dict.set_item(intern!(py, "url"), format!("data:{};base64,{}", mime, b64))?;
+                image_dict.set_item(intern!(py, "image_url"), url_dict)?;
 
                 images.push(image_dict);
             }
@@ -276,8 +277,8 @@ When remembering something, write to {}/memory/MEMORY.md"#,
         }
 
         let text_dict = PyDict::new(py);
-        text_dict.set_item("type", "text")?;
-        text_dict.set_item("text", text)?;
+        text_dict.set_item(intern!(py, "type"), "text")?;
+        text_dict.set_item(intern!(py, "text"), text)?;
         content.append(text_dict)?;
 
         Ok(content.into())
@@ -11,6 +11,8 @@ use std::sync::Arc;
 use std::time::{SystemTime, UNIX_EPOCH};
 use tokio::sync::Mutex;
 
+use crate::waker::{PyWaker, WakeHandle};
+
 fn now_ms() -> i64 {
     SystemTime::now()
         .duration_since(UNIX_EPOCH)
@@ -284,6 +286,7 @@ pub struct CronService {
     callback: Arc<Mutex<Option<PyObject>>>,
     jobs: Arc<Mutex<Vec<CronJob>>>,
     running: Arc<AtomicBool>,
+    waker: Arc<parking_lot::Mutex<Option<WakeHandle>>>,
 }
 
 #[pymethods]
@@ -296,16 +299,25 @@ impl CronService {
             callback: Arc::new(Mutex::new(on_job)),
             jobs: Arc::new(Mutex::new(Vec::new())),
             running: Arc::new(AtomicBool::new(false)),
+            waker: Arc::new(parking_lot::Mutex::new(None)),
         }
     }
 
+    /// Attach a self-pipe waker fired after each batch of due jobs.
+    fn set_waker(&self, waker: &PyWaker) {
+        *self.waker.lock() = Some(waker.handle());
+    }
+
     /// Set the callback function.
-    #[allow(unused_variables)]
     fn set_callback(&self, py: Python<'_>, callback: Option<PyObject>) -> PyResult<()> {
         let cb = self.callback.clone();
-        pyo3_async_runtimes::tokio::get_runtime().block_on(async move {
-            let mut guard = cb.lock().await;
-            *guard = callback;
+        // Release the GIL while blocking on the lock so other Python
+        // threads keep running.
+        py.allow_threads(|| {
+            crate::runtime::runtime().block_on(async move {
+                let mut guard = cb.lock().await;
+                *guard = callback;
+            })
         });
         Ok(())
     }
@@ -318,6 +330,7 @@ impl CronService {
         let jobs = self.jobs.clone();
         let callback = self.callback.clone();
         let running = self.running.clone();
+        let waker = self.waker.clone();
 
         future_into_py(py, async move {
             // Load jobs from disk
@@ -381,11 +394,18 @@ impl CronService {
                         .collect()
                 };
 
+                let fired = !due_job_ids.is_empty();
                 for job_id in due_job_ids {
                     execute_job(&jobs, &callback, &job_id).await;
                 }
 
                 save_store(&store_path, &jobs).await;
+
+                if fired {
+                    if let Some(w) = waker.lock().as_ref() {
+                        w.wake();
+                    }
+                }
             }
 
             Ok(())
@@ -561,15 +581,17 @@ impl CronService {
         dict.set_item("enabled", self.running.load(Ordering::Relaxed))?;
 
         let jobs = self.jobs.clone();
-        let (job_count, next_wake) = pyo3_async_runtimes::tokio::get_runtime().block_on(async {
-            let guard = jobs.lock().await;
-            let count = guard.len();
-            let wake = guard
-                .iter()
-                .filter(|j| j.enabled && j.state.next_run_at_ms.is_some())
-                .filter_map(|j| j.state.next_run_at_ms)
-                .min();
-            (count, wake)
+        let (job_count, next_wake) = py.allow_threads(|| {
+            crate::runtime::runtime().block_on(async {
+                let guard = jobs.lock().await;
+                let count = guard.len();
+                let wake = guard
+                    .iter()
+                    .filter(|j| j.enabled && j.state.next_run_at_ms.is_some())
+                    .filter_map(|j| j.state.next_run_at_ms)
+                    .min();
+                (count, wake)
+            })
         });
 
         dict.set_item("jobs", job_count)?;
@@ -725,9 +747,13 @@ async fn execute_job(
                 let bound = coro.into_bound(py);
                 let future = pyo3_async_runtimes::tokio::into_future(bound)?;
 
-                pyo3_async_runtimes::tokio::get_runtime().block_on(async {
-                    let _ = future.await?;
-                    Ok(())
+                // Drop the GIL while the callback runs on the event loop
+                // thread; it needs the GIL itself to make progress.
+                py.allow_threads(|| {
+                    crate::runtime::runtime().block_on(async {
+                        let _ = future.await?;
+                        Ok(())
+                    })
                 })
             })
             .map_err(|e| e.to_string())
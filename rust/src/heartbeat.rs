@@ -85,12 +85,15 @@ impl HeartbeatService {
     }
 
     /// Set the callback function.
-    #[allow(unused_variables)]
     fn set_callback(&self, py: Python<'_>, callback: Option<PyObject>) -> PyResult<()> {
         let cb = self.callback.clone();
-        pyo3_async_runtimes::tokio::get_runtime().block_on(async move {
-            let mut guard = cb.lock().await;
-            *guard = callback;
+        // Release the GIL while blocking on the lock so other Python
+        // threads keep running.
+        py.allow_threads(|| {
+            crate::runtime::runtime().block_on(async move {
+                let mut guard = cb.lock().await;
+                *guard = callback;
+            })
         });
         Ok(())
     }
@@ -157,9 +160,13 @@ impl HeartbeatService {
                     let bound = coro.into_bound(py);
                     let future = pyo3_async_runtimes::tokio::into_future(bound)?;
 
-                    pyo3_async_runtimes::tokio::get_runtime().block_on(async {
-                        let result = future.await?;
-                        Python::with_gil(|py| result.extract::<String>(py))
+                    // Drop the GIL while the callback runs on the event
+                    // loop thread; it needs the GIL itself to make progress.
+                    py.allow_threads(|| {
+                        crate::runtime::runtime().block_on(async {
+                            let result = future.await?;
+                            Python::with_gil(|py| result.extract::<String>(py))
+                        })
                     })
                 });
 
@@ -223,9 +230,13 @@ async fn tick_inner(
             let bound = coro.into_bound(py);
             let future = pyo3_async_runtimes::tokio::into_future(bound)?;
 
-            pyo3_async_runtimes::tokio::get_runtime().block_on(async {
-                let result = future.await?;
-                Python::with_gil(|py| result.extract::<String>(py))
+            // Drop the GIL while the callback runs on the event loop
+            // thread; it needs the GIL itself to make progress.
+            py.allow_threads(|| {
+                crate::runtime::runtime().block_on(async {
+                    let result = future.await?;
+                    Python::with_gil(|py| result.extract::<String>(py))
+                })
             })
         })
         .map_err(|e| format!("Callback error: {}", e))?;
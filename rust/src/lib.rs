@@ -7,9 +7,11 @@ mod heartbeat;
 mod memory;
 mod messages;
 mod router;
+mod runtime;
 mod session;
 mod skills;
 mod tools;
+mod waker;
 
 use bus::MessageBus;
 use context::ContextBuilder;
@@ -17,7 +19,7 @@ use cron::{CronJob, CronJobState, CronPayload, CronSchedule, CronService};
 use heartbeat::HeartbeatService;
 use memory::MemoryStore;
 use messages::{InboundMessage, OutboundMessage};
-use session::{Session, SessionManager};
+use session::{HistoryView, Session, SessionManager};
 use skills::SkillsLoader;
 use tools::{
     EditFileTool, ExecTool, ListDirTool, ReadFileTool, ToolRegistry, WebFetchTool, WebSearchTool,
@@ -31,6 +33,7 @@ fn debot_rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<InboundMessage>()?;
     m.add_class::<OutboundMessage>()?;
     m.add_class::<MessageBus>()?;
+    m.add_class::<waker::PyWaker>()?;
 
     // Tool classes
     m.add_class::<ToolRegistry>()?;
@@ -44,6 +47,7 @@ fn debot_rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Session classes
     m.add_class::<Session>()?;
+    m.add_class::<HistoryView>()?;
     m.add_class::<SessionManager>()?;
 
     // Memory classes
@@ -63,6 +67,9 @@ fn debot_rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<CronPayload>()?;
     m.add_class::<CronJobState>()?;
 
+    // Shared runtime init hook
+    m.add_function(wrap_pyfunction!(runtime::_runtime_handle, m)?)?;
+
     // Router bindings
     router::pybindings(m)?;
 
@@ -6,6 +6,7 @@ use reqwest::blocking::Client;
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use sha2::{Digest, Sha256};
+use std::collections::HashMap;
 use std::env;
 use std::fs;
 use std::io::Write;
@@ -174,71 +175,81 @@ impl MemoryStore {
         Ok(result.into())
     }
 
-    /// Build a simple, local vector index for all markdown memory files.
-    /// This uses a deterministic local embedding (SHA256-based) so no external API is required.
+    /// Build or refresh the local vector index for all markdown memory files.
+    ///
+    /// The index is keyed per file with its mtime and size, so unchanged
+    /// files keep their chunks from the previous build and only new or
+    /// modified files are re-embedded. Removed files drop out of the
+    /// index. Uses a deterministic local embedding (SHA256-based) when no
+    /// external API is configured.
     pub fn build_index(&self) -> PyResult<usize> {
-        let mut entries: Vec<IndexEntry> = Vec::new();
-
         if !self.memory_dir.exists() {
             return Ok(0);
         }
 
+        let old_files = load_index(&self.index_file)
+            .map(|idx| idx.files)
+            .unwrap_or_default();
+
+        let mut files: HashMap<String, FileIndex> = HashMap::new();
+
         if let Ok(entries_iter) = fs::read_dir(&self.memory_dir) {
             for entry in entries_iter.flatten() {
                 let path = entry.path();
                 if !path.is_file() {
                     continue;
                 }
-                if let Some(name) = path.file_name().and_then(|n| n.to_str()) {
-                    if name.ends_with(".md") {
-                        if let Ok(text) = fs::read_to_string(&path) {
-                            // Chunk by roughly 800 characters with 100 char overlap
-                            let chunk_size = 800;
-                            let overlap = 100;
-                            let mut start = 0usize;
-                            let len = text.len();
-                            while start < len {
-                                let end = if start + chunk_size > len {
-                                    len
-                                } else {
-                                    start + chunk_size
-                                };
-                                let chunk = &text[start..end];
-                                let vec = embed_text(chunk);
-                                let id = Uuid::new_v4().to_string();
-                                let entry = IndexEntry {
-                                    id,
-                                    path: path
-                                        .strip_prefix(&self.workspace)
-                                        .unwrap_or(&path)
-                                        .to_string_lossy()
-                                        .to_string(),
-                                    start_line: 0,
-                                    end_line: 0,
-                                    text: chunk.to_string(),
-                                    vector: vec,
-                                };
-                                entries.push(entry);
-                                if end == len {
-                                    break;
-                                }
-                                start = end.saturating_sub(overlap);
-                            }
-                        }
+                let Some(name) = path.file_name().and_then(|n| n.to_str()) else {
+                    continue;
+                };
+                if !name.ends_with(".md") {
+                    continue;
+                }
+                let rel = path
+                    .strip_prefix(&self.workspace)
+                    .unwrap_or(&path)
+                    .to_string_lossy()
+                    .to_string();
+                let Ok(meta) = entry.metadata() else { continue };
+                let mtime_ns = meta
+                    .modified()
+                    .ok()
+                    .and_then(|t| t.duration_since(std::time::UNIX_EPOCH).ok())
+                    .map(|d| d.as_nanos() as i64)
+                    .unwrap_or(0);
+                let size = meta.len();
+
+                if let Some(cached) = old_files.get(&rel) {
+                    if cached.mtime_ns == mtime_ns && cached.size == size {
+                        files.insert(rel, cached.clone());
+                        continue;
                     }
                 }
+
+                if let Some(entries) = with_mapped_text(&path, |text| chunk_and_embed(text, &rel)) {
+                    files.insert(
+                        rel.clone(),
+                        FileIndex {
+                            mtime_ns,
+                            size,
+                            entries,
+                        },
+                    );
+                }
             }
         }
 
-        // Serialize index to file
-        let json = serde_json::to_string_pretty(&entries).map_err(|e| {
+        let index = IndexFile { files };
+        let json = serde_json::to_string_pretty(&index).map_err(|e| {
             PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
                 "Failed to serialize index: {}",
                 e
             ))
         })?;
 
-        let mut f = fs::File::create(&self.index_file).map_err(|e| {
+        // Atomic rename so a crash mid-write never leaves a torn index.
+        let tmp_file = self.index_file.with_extension("json.tmp");
+        let mut f = fs::File::create(&tmp_file).map_err(|e| {
             PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
                 "Failed to create index file: {}",
                 e
@@ -250,8 +261,14 @@ impl MemoryStore {
                 e
             ))
         })?;
+        fs::rename(&tmp_file, &self.index_file).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
+                "Failed to replace index file: {}",
+                e
+            ))
+        })?;
 
-        Ok(entries.len())
+        Ok(index.files.values().map(|f| f.entries.len()).sum())
     }
 
     /// Search the local index for semantically similar chunks to `query`.
@@ -267,25 +284,16 @@ impl MemoryStore {
         #[allow(unused_mut)]
         let mut result = PyList::empty(py);
 
-        if !self.index_file.exists() {
+        let Some(index) = load_index(&self.index_file) else {
             return Ok(result.into());
-        }
-
-        let json = fs::read_to_string(&self.index_file).map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
-                "Failed to read index file: {}",
-                e
-            ))
-        })?;
-
-        let entries: Vec<IndexEntry> = serde_json::from_str(&json).map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Failed to parse index: {}", e))
-        })?;
+        };
 
         let qvec = embed_text(&query);
 
-        let mut scored: Vec<(f32, &IndexEntry)> = entries
-            .iter()
+        let mut scored: Vec<(f32, &IndexEntry)> = index
+            .files
+            .values()
+            .flat_map(|f| f.entries.iter())
             .map(|e| {
                 let score = cosine_similarity(&qvec, &e.vector);
                 (score, e)
@@ -353,7 +361,7 @@ fn today_date() -> String {
     chrono::Local::now().format("%Y-%m-%d").to_string()
 }
 
-#[derive(Serialize, Deserialize)]
+#[derive(Clone, Serialize, Deserialize)]
 struct IndexEntry {
     id: String,
     path: String,
@@ -363,6 +371,75 @@ struct IndexEntry {
     vector: Vec<f32>,
 }
 
+/// Indexed chunks for one memory file plus the stat snapshot used for
+/// incremental invalidation.
+#[derive(Clone, Serialize, Deserialize)]
+struct FileIndex {
+    mtime_ns: i64,
+    size: u64,
+    entries: Vec<IndexEntry>,
+}
+
+/// On-disk index layout (`memory/.index.json`).
+#[derive(Default, Serialize, Deserialize)]
+struct IndexFile {
+    files: HashMap<String, FileIndex>,
+}
+
+/// Load the index, returning None when absent or unreadable (stale or
+/// torn indexes are simply rebuilt).
+fn load_index(path: &PathBuf) -> Option<IndexFile> {
+    let json = fs::read_to_string(path).ok()?;
+    serde_json::from_str(&json).ok()
+}
+
+/// Run `f` over a file's text mapped directly into memory.
+///
+/// Skips the user-space copy of a heap read; the chunker slices the
+/// mapping in place and only allocates for the chunks it keeps. Returns
+/// None for unreadable or non-UTF-8 files.
+fn with_mapped_text<R>(path: &std::path::Path, f: impl FnOnce(&str) -> R) -> Option<R> {
+    let file = fs::File::open(path).ok()?;
+    let len = file.metadata().ok()?.len();
+    if len == 0 {
+        // Zero-length mappings are rejected on some platforms.
+        return Some(f(""));
+    }
+    let mmap = unsafe { memmap2::Mmap::map(&file).ok()? };
+    let text = std::str::from_utf8(&mmap).ok()?;
+    Some(f(text))
+}
+
+/// Split file text into overlapping ~800 char chunks and embed each one.
+fn chunk_and_embed(text: &str, rel_path: &str) -> Vec<IndexEntry> {
+    let chunk_size = 800;
+    let overlap = 100;
+    let mut entries = Vec::new();
+    let mut start = 0usize;
+    let len = text.len();
+    while start < len {
+        let end = if start + chunk_size > len {
+            len
+        } else {
+            start + chunk_size
+        };
+        let chunk = &text[start..end];
+        entries.push(IndexEntry {
+            id: Uuid::new_v4().to_string(),
+            path: rel_path.to_string(),
+            start_line: 0,
+            end_line: 0,
+            text: chunk.to_string(),
+            vector: embed_text(chunk),
+        });
+        if end == len {
+            break;
+        }
+        start = end.saturating_sub(overlap);
+    }
+    entries
+}
+
 /// Create a deterministic local embedding for `text` using SHA256.
 /// This is a placeholder for a real embedding API and yields a fixed-length vector.
 fn embed_local(text: &str) -> Vec<f32> {
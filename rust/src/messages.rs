@@ -1,7 +1,7 @@
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyString};
 use std::collections::HashMap;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use std::time::{SystemTime, UNIX_EPOCH};
 
 /// Thread-safe wrapper for Python objects in metadata.
@@ -18,23 +18,58 @@ impl PyValue {
     }
 }
 
+/// Lazily-created Python string for a message field.
+///
+/// The Rust `String` is the source of truth; the Python object is only
+/// materialized on first attribute access and reused afterwards, so
+/// messages that just flow through the bus never allocate PyStrings.
+#[derive(Default)]
+struct LazyStr(OnceLock<Py<PyString>>);
+
+impl LazyStr {
+    fn get<'py>(&self, py: Python<'py>, value: &str) -> Bound<'py, PyString> {
+        self.0
+            .get_or_init(|| PyString::new(py, value).unbind())
+            .bind(py)
+            .clone()
+    }
+}
+
 /// Message received from a chat channel.
 #[pyclass]
-#[derive(Clone)]
 pub struct InboundMessage {
-    #[pyo3(get, set)]
     pub channel: String,
-    #[pyo3(get, set)]
     pub sender_id: String,
-    #[pyo3(get, set)]
     pub chat_id: String,
-    #[pyo3(get, set)]
     pub content: String,
     #[pyo3(get, set)]
     pub timestamp: f64,
     #[pyo3(get, set)]
     pub media: Vec<String>,
     metadata: HashMap<String, PyValue>,
+    channel_py: LazyStr,
+    sender_id_py: LazyStr,
+    chat_id_py: LazyStr,
+    content_py: LazyStr,
+}
+
+impl Clone for InboundMessage {
+    fn clone(&self) -> Self {
+        Self {
+            channel: self.channel.clone(),
+            sender_id: self.sender_id.clone(),
+            chat_id: self.chat_id.clone(),
+            content: self.content.clone(),
+            timestamp: self.timestamp,
+            media: self.media.clone(),
+            metadata: self.metadata.clone(),
+            // Python-side caches are per-instance; clones refill lazily.
+            channel_py: LazyStr::default(),
+            sender_id_py: LazyStr::default(),
+            chat_id_py: LazyStr::default(),
+            content_py: LazyStr::default(),
+        }
+    }
 }
 
 #[pymethods]
@@ -43,7 +78,6 @@ impl InboundMessage {
     #[pyo3(signature = (channel, sender_id, chat_id, content, timestamp=None, media=None, metadata=None))]
     #[allow(clippy::too_many_arguments)]
     fn new(
-        _py: Python<'_>,
         channel: String,
         sender_id: String,
         chat_id: String,
@@ -78,6 +112,10 @@ impl InboundMessage {
             timestamp: ts,
             media: media.unwrap_or_default(),
             metadata: meta,
+            channel_py: LazyStr::default(),
+            sender_id_py: LazyStr::default(),
+            chat_id_py: LazyStr::default(),
+            content_py: LazyStr::default(),
         })
     }
 
@@ -88,16 +126,60 @@ impl InboundMessage {
     }
 
     #[getter]
-    fn metadata(&self, py: Python<'_>) -> PyResult<PyObject> {
+    fn channel<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.channel_py.get(py, &self.channel)
+    }
+
+    #[setter]
+    fn set_channel(&mut self, value: String) {
+        self.channel = value;
+        self.channel_py = LazyStr::default();
+    }
+
+    #[getter]
+    fn sender_id<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.sender_id_py.get(py, &self.sender_id)
+    }
+
+    #[setter]
+    fn set_sender_id(&mut self, value: String) {
+        self.sender_id = value;
+        self.sender_id_py = LazyStr::default();
+    }
+
+    #[getter]
+    fn chat_id<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.chat_id_py.get(py, &self.chat_id)
+    }
+
+    #[setter]
+    fn set_chat_id(&mut self, value: String) {
+        self.chat_id = value;
+        self.chat_id_py = LazyStr::default();
+    }
+
+    #[getter]
+    fn content<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.content_py.get(py, &self.content)
+    }
+
+    #[setter]
+    fn set_content(&mut self, value: String) {
+        self.content = value;
+        self.content_py = LazyStr::default();
+    }
+
+    #[getter]
+    fn metadata<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
         let dict = PyDict::new(py);
         for (key, value) in &self.metadata {
             dict.set_item(key, value.get().bind(py))?;
         }
-        Ok(dict.into())
+        Ok(dict)
     }
 
     #[setter]
-    fn set_metadata(&mut self, _py: Python<'_>, value: Bound<'_, PyDict>) -> PyResult<()> {
+    fn set_metadata(&mut self, value: Bound<'_, PyDict>) -> PyResult<()> {
         let mut map = HashMap::new();
         for (key, val) in value.iter() {
             let key_str: String = key.extract()?;
@@ -117,19 +199,34 @@ impl InboundMessage {
 
 /// Message to send to a chat channel.
 #[pyclass]
-#[derive(Clone)]
 pub struct OutboundMessage {
-    #[pyo3(get, set)]
     pub channel: String,
-    #[pyo3(get, set)]
     pub chat_id: String,
-    #[pyo3(get, set)]
     pub content: String,
     #[pyo3(get, set)]
     pub reply_to: Option<String>,
     #[pyo3(get, set)]
     pub media: Vec<String>,
     metadata: HashMap<String, PyValue>,
+    channel_py: LazyStr,
+    chat_id_py: LazyStr,
+    content_py: LazyStr,
+}
+
+impl Clone for OutboundMessage {
+    fn clone(&self) -> Self {
+        Self {
+            channel: self.channel.clone(),
+            chat_id: self.chat_id.clone(),
+            content: self.content.clone(),
+            reply_to: self.reply_to.clone(),
+            media: self.media.clone(),
+            metadata: self.metadata.clone(),
+            channel_py: LazyStr::default(),
+            chat_id_py: LazyStr::default(),
+            content_py: LazyStr::default(),
+        }
+    }
 }
 
 #[pymethods]
@@ -137,7 +234,6 @@ impl OutboundMessage {
     #[new]
     #[pyo3(signature = (channel, chat_id, content, reply_to=None, media=None, metadata=None))]
     fn new(
-        _py: Python<'_>,
         channel: String,
         chat_id: String,
         content: String,
@@ -163,20 +259,56 @@ impl OutboundMessage {
             reply_to,
             media: media.unwrap_or_default(),
             metadata: meta,
+            channel_py: LazyStr::default(),
+            chat_id_py: LazyStr::default(),
+            content_py: LazyStr::default(),
         })
     }
 
     #[getter]
-    fn metadata(&self, py: Python<'_>) -> PyResult<PyObject> {
+    fn channel<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.channel_py.get(py, &self.channel)
+    }
+
+    #[setter]
+    fn set_channel(&mut self, value: String) {
+        self.channel = value;
+        self.channel_py = LazyStr::default();
+    }
+
+    #[getter]
+    fn chat_id<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.chat_id_py.get(py, &self.chat_id)
+    }
+
+    #[setter]
+    fn set_chat_id(&mut self, value: String) {
+        self.chat_id = value;
+        self.chat_id_py = LazyStr::default();
+    }
+
+    #[getter]
+    fn content<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.content_py.get(py, &self.content)
+    }
+
+    #[setter]
+    fn set_content(&mut self, value: String) {
+        self.content = value;
+        self.content_py = LazyStr::default();
+    }
+
+    #[getter]
+    fn metadata<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
         let dict = PyDict::new(py);
         for (key, value) in &self.metadata {
             dict.set_item(key, value.get().bind(py))?;
         }
-        Ok(dict.into())
+        Ok(dict)
     }
 
     #[setter]
-    fn set_metadata(&mut self, _py: Python<'_>, value: Bound<'_, PyDict>) -> PyResult<()> {
+    fn set_metadata(&mut self, value: Bound<'_, PyDict>) -> PyResult<()> {
         let mut map = HashMap::new();
         for (key, val) in value.iter() {
             let key_str: String = key.extract()?;
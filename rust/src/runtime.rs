@@ -0,0 +1,22 @@
+use pyo3::prelude::*;
+use tokio::runtime::Runtime;
+
+/// Shared long-lived Tokio runtime for all bindings.
+///
+/// Bus, cron, heartbeat and tool futures all run on the single runtime
+/// managed by pyo3-async-runtimes; this module is the one place that
+/// touches it so no binding spins up (or looks up) its own.
+pub fn runtime() -> &'static Runtime {
+    pyo3_async_runtimes::tokio::get_runtime()
+}
+
+/// Eagerly initialize the shared Tokio runtime.
+///
+/// Called once from `debot.bus.__init__` after a successful extension
+/// import so runtime startup cost is paid at import time rather than on
+/// the first `publish_inbound` or cron tick. Returns the worker thread
+/// count so callers can log it.
+#[pyfunction]
+pub fn _runtime_handle() -> usize {
+    runtime().metrics().num_workers()
+}
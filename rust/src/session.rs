@@ -1,14 +1,16 @@
 //! Session management for conversation history.
 
 use parking_lot::Mutex;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList, PyString};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fs::{self, File};
-use std::io::{BufRead, BufReader, Write};
+use std::io::{BufRead, BufReader};
 use std::path::PathBuf;
 use std::sync::Arc;
+use std::time::SystemTime;
 
 /// A conversation message.
 #[derive(Clone, Serialize, Deserialize)]
@@ -31,11 +33,15 @@ struct SessionMetadata {
 }
 
 /// A conversation session.
+///
+/// Messages live behind an `Arc` so history views and cache entries
+/// share the storage; mutation goes through `Arc::make_mut`, which
+/// copies only while a view is alive (copy-on-write).
 #[pyclass]
 pub struct Session {
     #[pyo3(get)]
     key: String,
-    messages: Vec<Message>,
+    messages: Arc<Vec<Message>>,
     created_at: String,
     updated_at: String,
     metadata: HashMap<String, serde_json::Value>,
@@ -57,43 +63,7 @@ impl Session {
             .to_string();
 
         let msgs = if let Some(py_msgs) = messages {
-            let mut result = Vec::new();
-            for item in py_msgs.iter() {
-                let dict = item.downcast::<PyDict>()?;
-                let role: String = dict
-                    .get_item("role")?
-                    .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("missing 'role'"))?
-                    .extract()?;
-                let content: String = dict
-                    .get_item("content")?
-                    .ok_or_else(|| {
-                        PyErr::new::<pyo3::exceptions::PyKeyError, _>("missing 'content'")
-                    })?
-                    .extract()?;
-                let timestamp: String = dict
-                    .get_item("timestamp")?
-                    .map(|v| v.extract())
-                    .transpose()?
-                    .unwrap_or_else(|| now.clone());
-
-                // Collect extra fields
-                let mut extra = HashMap::new();
-                for (k, v) in dict.iter() {
-                    let key: String = k.extract()?;
-                    if key != "role" && key != "content" && key != "timestamp" {
-                        let value = python_to_json(v)?;
-                        extra.insert(key, value);
-                    }
-                }
-
-                result.push(Message {
-                    role,
-                    content,
-                    timestamp,
-                    extra,
-                });
-            }
-            result
+            extract_messages(py_msgs, &now)?
         } else {
             Vec::new()
         };
@@ -106,7 +76,7 @@ impl Session {
 
         Ok(Session {
             key,
-            messages: msgs,
+            messages: Arc::new(msgs),
             created_at: created_at.unwrap_or_else(|| now.clone()),
             updated_at: updated_at.unwrap_or(now),
             metadata: meta,
@@ -134,7 +104,7 @@ impl Session {
             }
         }
 
-        self.messages.push(Message {
+        Arc::make_mut(&mut self.messages).push(Message {
             role,
             content,
             timestamp: now.clone(),
@@ -144,6 +114,21 @@ impl Session {
         Ok(())
     }
 
+    /// Add several messages in one call.
+    ///
+    /// Crosses the FFI boundary once for the whole batch and stamps
+    /// `updated_at` once at the end, instead of per message.
+    fn add_messages(&mut self, messages: &Bound<'_, PyList>) -> PyResult<()> {
+        let now = chrono::Utc::now()
+            .format("%Y-%m-%dT%H:%M:%S%.6f")
+            .to_string();
+
+        let batch = extract_messages(messages, &now)?;
+        Arc::make_mut(&mut self.messages).extend(batch);
+        self.updated_at = now;
+        Ok(())
+    }
+
     /// Get message history for LLM context.
     #[pyo3(signature = (max_messages=50))]
     fn get_history(&self, py: Python<'_>, max_messages: usize) -> PyResult<Py<PyList>> {
@@ -156,8 +141,10 @@ impl Session {
         let result = PyList::empty(py);
         for msg in &self.messages[start..] {
             let dict = PyDict::new(py);
-            dict.set_item("role", &msg.role)?;
-            dict.set_item("content", &msg.content)?;
+            // Interned keys hit the cached-hash pointer-compare fast
+            // path in dict lookup instead of hashing per message.
+            dict.set_item(intern!(py, "role"), &msg.role)?;
+            dict.set_item(intern!(py, "content"), &msg.content)?;
             result.append(dict)?;
         }
 
@@ -166,7 +153,7 @@ impl Session {
 
     /// Clear all messages in the session.
     fn clear(&mut self) {
-        self.messages.clear();
+        Arc::make_mut(&mut self.messages).clear();
         self.updated_at = chrono::Utc::now()
             .format("%Y-%m-%dT%H:%M:%S%.6f")
             .to_string();
@@ -188,11 +175,11 @@ impl Session {
     #[getter]
     fn messages(&self, py: Python<'_>) -> PyResult<Py<PyList>> {
         let result = PyList::empty(py);
-        for msg in &self.messages {
+        for msg in self.messages.iter() {
             let dict = PyDict::new(py);
-            dict.set_item("role", &msg.role)?;
-            dict.set_item("content", &msg.content)?;
-            dict.set_item("timestamp", &msg.timestamp)?;
+            dict.set_item(intern!(py, "role"), &msg.role)?;
+            dict.set_item(intern!(py, "content"), &msg.content)?;
+            dict.set_item(intern!(py, "timestamp"), &msg.timestamp)?;
             for (k, v) in &msg.extra {
                 dict.set_item(k, json_to_python(py, v)?)?;
             }
@@ -217,6 +204,71 @@ impl Session {
         self.metadata = python_dict_to_json_map(value)?;
         Ok(())
     }
+
+    /// Get a lazy read-only view of the last `max_messages` messages.
+    ///
+    /// Shares the session's message storage (no copy at creation) and
+    /// builds a `{"role", "content"}` dict only for the indices a
+    /// consumer actually touches, unlike `get_history` which
+    /// materializes every row up front.
+    #[pyo3(signature = (max_messages=50))]
+    fn history_view(&self, max_messages: usize) -> HistoryView {
+        let start = self.messages.len().saturating_sub(max_messages);
+        HistoryView {
+            messages: Arc::clone(&self.messages),
+            start,
+        }
+    }
+}
+
+/// Lazy read-only window over a session's message history.
+///
+/// Snapshot semantics: the view keeps the `Arc` alive, so later
+/// mutations of the session copy-on-write and do not show up here.
+#[pyclass]
+pub struct HistoryView {
+    messages: Arc<Vec<Message>>,
+    start: usize,
+}
+
+#[pymethods]
+impl HistoryView {
+    fn __len__(&self) -> usize {
+        self.messages.len() - self.start
+    }
+
+    fn __getitem__(&self, py: Python<'_>, index: isize) -> PyResult<PyObject> {
+        let len = (self.messages.len() - self.start) as isize;
+        let index = if index < 0 { index + len } else { index };
+        if index < 0 || index >= len {
+            return Err(pyo3::exceptions::PyIndexError::new_err(
+                "history index out of range",
+            ));
+        }
+
+        let msg = &self.messages[self.start + index as usize];
+        let dict = PyDict::new(py);
+        dict.set_item(intern!(py, "role"), &msg.role)?;
+        dict.set_item(intern!(py, "content"), &msg.content)?;
+        Ok(dict.into())
+    }
+
+    fn __repr__(&self) -> String {
+        format!("HistoryView(len={})", self.messages.len() - self.start)
+    }
+}
+
+/// Sidecar mapping file stem -> session info, so list_sessions reads
+/// one file instead of the first line of every session file.
+const INDEX_FILE: &str = ".sessions_index.json";
+
+/// One list_sessions record, persisted in the index sidecar.
+#[derive(Clone, Serialize, Deserialize)]
+struct IndexEntry {
+    key: String,
+    created_at: String,
+    updated_at: String,
+    path: String,
 }
 
 /// Manages conversation sessions.
@@ -225,13 +277,89 @@ impl Session {
 pub struct SessionManager {
     workspace: PathBuf,
     sessions_dir: PathBuf,
-    cache: Arc<Mutex<HashMap<String, SessionData>>>,
+    cache: Arc<Mutex<SessionCache>>,
+    // Lazily loaded view of the index sidecar; empty until first use.
+    index: Arc<Mutex<IndexCache>>,
+}
+
+/// Cached view of the index sidecar plus the mtime it was read at.
+///
+/// The sessions directory is shared across processes (e.g. gateway plus
+/// a CLI command), so the cache is re-read whenever the sidecar's mtime
+/// has moved; otherwise a stale in-memory index persisted back would
+/// erase entries another process wrote.
+#[derive(Default)]
+struct IndexCache {
+    entries: Option<HashMap<String, IndexEntry>>,
+    mtime: Option<SystemTime>,
+}
+
+/// Bounded LRU cache of loaded sessions, keyed by session key.
+///
+/// Entries carry a logical timestamp updated on every access; when the
+/// cache is full the entry with the oldest stamp is evicted. Hit and
+/// miss counters back `SessionManager.cache_stats()`.
+struct SessionCache {
+    entries: HashMap<String, (u64, SessionData)>,
+    tick: u64,
+    hits: u64,
+    misses: u64,
+}
+
+impl SessionCache {
+    const CAPACITY: usize = 4096;
+
+    fn new() -> Self {
+        SessionCache {
+            entries: HashMap::new(),
+            tick: 0,
+            hits: 0,
+            misses: 0,
+        }
+    }
+
+    fn get(&mut self, key: &str) -> Option<Session> {
+        self.tick += 1;
+        match self.entries.get_mut(key) {
+            Some((stamp, data)) => {
+                *stamp = self.tick;
+                self.hits += 1;
+                Some(data.to_session())
+            }
+            None => {
+                self.misses += 1;
+                None
+            }
+        }
+    }
+
+    fn insert(&mut self, key: String, data: SessionData) {
+        self.tick += 1;
+        if self.entries.len() >= Self::CAPACITY && !self.entries.contains_key(&key) {
+            let oldest = self
+                .entries
+                .iter()
+                .min_by_key(|(_, (stamp, _))| *stamp)
+                .map(|(k, _)| k.clone());
+            if let Some(oldest) = oldest {
+                self.entries.remove(&oldest);
+            }
+        }
+        self.entries.insert(key, (self.tick, data));
+    }
+
+    fn remove(&mut self, key: &str) {
+        self.entries.remove(key);
+    }
 }
 
 /// Internal session data for caching.
+///
+/// Shares message storage with live `Session` objects via `Arc`, so
+/// caching a session is a pointer bump rather than a deep copy.
 struct SessionData {
     key: String,
-    messages: Vec<Message>,
+    messages: Arc<Vec<Message>>,
     created_at: String,
     updated_at: String,
     metadata: HashMap<String, serde_json::Value>,
@@ -281,7 +409,8 @@ impl SessionManager {
         Ok(SessionManager {
             workspace,
             sessions_dir,
-            cache: Arc::new(Mutex::new(HashMap::new())),
+            cache: Arc::new(Mutex::new(SessionCache::new())),
+            index: Arc::new(Mutex::new(IndexCache::default())),
         })
     }
 
@@ -289,9 +418,9 @@ impl SessionManager {
     fn get_or_create(&self, key: String) -> PyResult<Session> {
         // Check cache first
         {
-            let cache = self.cache.lock();
-            if let Some(data) = cache.get(&key) {
-                return Ok(data.to_session());
+            let mut cache = self.cache.lock();
+            if let Some(session) = cache.get(&key) {
+                return Ok(session);
             }
         }
 
@@ -304,7 +433,7 @@ impl SessionManager {
                     .to_string();
                 Session {
                     key: key.clone(),
-                    messages: Vec::new(),
+                    messages: Arc::new(Vec::new()),
                     created_at: now.clone(),
                     updated_at: now,
                     metadata: HashMap::new(),
@@ -317,7 +446,7 @@ impl SessionManager {
                     .to_string();
                 Session {
                     key: key.clone(),
-                    messages: Vec::new(),
+                    messages: Arc::new(Vec::new()),
                     created_at: now.clone(),
                     updated_at: now,
                     metadata: HashMap::new(),
@@ -336,47 +465,13 @@ impl SessionManager {
 
     /// Save a session to disk.
     fn save(&self, session: &Session) -> PyResult<()> {
-        let path = self.get_session_path(&session.key);
-
-        let mut file = File::create(&path).map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
-                "Failed to create session file: {}",
-                e
-            ))
-        })?;
-
-        // Write metadata first
-        let metadata = SessionMetadata {
-            type_marker: "metadata".to_string(),
-            created_at: session.created_at.clone(),
-            updated_at: session.updated_at.clone(),
-            metadata: session.metadata.clone(),
-        };
-        let meta_json = serde_json::to_string(&metadata).map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
-                "Failed to serialize metadata: {}",
-                e
-            ))
-        })?;
-        writeln!(file, "{}", meta_json).map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyIOError, _>(format!("Failed to write metadata: {}", e))
-        })?;
+        let payload = serialize_session(session)?;
+        self.write_session(&session.key, &payload)?;
 
-        // Write messages
-        for msg in &session.messages {
-            let msg_json = serde_json::to_string(msg).map_err(|e| {
-                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
-                    "Failed to serialize message: {}",
-                    e
-                ))
-            })?;
-            writeln!(file, "{}", msg_json).map_err(|e| {
-                PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
-                    "Failed to write message: {}",
-                    e
-                ))
-            })?;
-        }
+        let (stem, entry) = self.index_entry(session);
+        self.update_index(|index| {
+            index.insert(stem, entry);
+        });
 
         // Update cache
         {
@@ -387,6 +482,61 @@ impl SessionManager {
         Ok(())
     }
 
+    /// Save several sessions in one call.
+    ///
+    /// Serializes every payload up front, then issues a single write per
+    /// file, so N small saves become N writes with no per-call Python
+    /// round trips in between.
+    fn save_many(&self, sessions: Vec<PyRef<'_, Session>>) -> PyResult<()> {
+        let mut payloads = Vec::with_capacity(sessions.len());
+        for session in &sessions {
+            payloads.push(serialize_session(session)?);
+        }
+
+        for (session, payload) in sessions.iter().zip(&payloads) {
+            self.write_session(&session.key, payload)?;
+        }
+
+        // One index rewrite for the whole batch
+        self.update_index(|index| {
+            for session in &sessions {
+                let path = self.get_session_path(&session.key);
+                let stem = path
+                    .file_stem()
+                    .and_then(|s| s.to_str())
+                    .unwrap_or(&session.key)
+                    .to_string();
+                index.insert(
+                    stem,
+                    IndexEntry {
+                        key: session.key.clone(),
+                        created_at: session.created_at.clone(),
+                        updated_at: session.updated_at.clone(),
+                        path: path.to_string_lossy().to_string(),
+                    },
+                );
+            }
+        });
+
+        let mut cache = self.cache.lock();
+        for session in &sessions {
+            cache.insert(session.key.clone(), SessionData::from_session(session));
+        }
+
+        Ok(())
+    }
+
+    /// Cache hit/miss counters and occupancy, for tests and diagnostics.
+    fn cache_stats(&self, py: Python<'_>) -> PyResult<PyObject> {
+        let cache = self.cache.lock();
+        let dict = PyDict::new(py);
+        dict.set_item("hits", cache.hits)?;
+        dict.set_item("misses", cache.misses)?;
+        dict.set_item("size", cache.entries.len())?;
+        dict.set_item("capacity", SessionCache::CAPACITY)?;
+        Ok(dict.into())
+    }
+
     /// Delete a session.
     fn delete(&self, key: String) -> PyResult<bool> {
         // Remove from cache
@@ -395,8 +545,16 @@ impl SessionManager {
             cache.remove(&key);
         }
 
-        // Remove file
+        // Remove the index entry
         let path = self.get_session_path(&key);
+        if let Some(stem) = path.file_stem().and_then(|s| s.to_str()) {
+            let stem = stem.to_string();
+            self.update_index(|index| {
+                index.remove(&stem);
+            });
+        }
+
+        // Remove file
         if path.exists() {
             fs::remove_file(&path).map_err(|e| {
                 PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
@@ -411,24 +569,65 @@ impl SessionManager {
     }
 
     /// List all sessions.
+    ///
+    /// Served from the index sidecar (one read) rather than opening
+    /// every session file; the sidecar is rebuilt by scanning when it
+    /// is missing or unreadable.
     fn list_sessions(&self, py: Python<'_>) -> PyResult<Py<PyList>> {
+        let mut sessions: Vec<IndexEntry> = {
+            let mut cache = self.index.lock();
+            self.ensure_index(&mut cache);
+            cache.entries.as_ref().unwrap().values().cloned().collect()
+        };
+
+        // Sort by updated_at descending
+        sessions.sort_by(|a, b| b.updated_at.cmp(&a.updated_at));
+
         let result = PyList::empty(py);
+        for entry in sessions {
+            let dict = PyDict::new(py);
+            dict.set_item("key", entry.key)?;
+            dict.set_item("created_at", entry.created_at)?;
+            dict.set_item("updated_at", entry.updated_at)?;
+            dict.set_item("path", entry.path)?;
+            result.append(dict)?;
+        }
+
+        Ok(result.into())
+    }
+}
+
+impl SessionManager {
+    fn get_session_path(&self, key: &str) -> PathBuf {
+        let safe_key = safe_filename(&key.replace(":", "_"));
+        self.sessions_dir.join(format!("{}.jsonl", safe_key))
+    }
 
-        let entries = fs::read_dir(&self.sessions_dir).map_err(|e| {
+    /// Write a fully serialized session payload with a single write call.
+    fn write_session(&self, key: &str, payload: &str) -> PyResult<()> {
+        let path = self.get_session_path(key);
+        fs::write(&path, payload).map_err(|e| {
             PyErr::new::<pyo3::exceptions::PyIOError, _>(format!(
-                "Failed to read sessions directory: {}",
+                "Failed to write session file: {}",
                 e
             ))
-        })?;
+        })
+    }
 
-        let mut sessions: Vec<(String, String, String, String)> = Vec::new();
+    fn index_path(&self) -> PathBuf {
+        self.sessions_dir.join(INDEX_FILE)
+    }
 
-        for entry in entries {
-            let entry = match entry {
-                Ok(e) => e,
-                Err(_) => continue,
-            };
+    /// Rebuild the index by reading every session file's metadata line.
+    fn scan_index(&self) -> HashMap<String, IndexEntry> {
+        let mut index = HashMap::new();
 
+        let entries = match fs::read_dir(&self.sessions_dir) {
+            Ok(e) => e,
+            Err(_) => return index,
+        };
+
+        for entry in entries.flatten() {
             let path = entry.path();
             if path.extension().and_then(|e| e.to_str()) != Some("jsonl") {
                 continue;
@@ -454,46 +653,98 @@ impl SessionManager {
                 continue;
             }
 
-            let key = path
-                .file_stem()
-                .and_then(|s| s.to_str())
-                .map(|s| s.replace("_", ":"))
-                .unwrap_or_default();
-            let created_at = data
-                .get("created_at")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_string();
-            let updated_at = data
-                .get("updated_at")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_string();
-            let path_str = path.to_string_lossy().to_string();
-
-            sessions.push((key, created_at, updated_at, path_str));
+            let stem = match path.file_stem().and_then(|s| s.to_str()) {
+                Some(s) => s.to_string(),
+                None => continue,
+            };
+
+            index.insert(
+                stem.clone(),
+                IndexEntry {
+                    key: stem.replace("_", ":"),
+                    created_at: data
+                        .get("created_at")
+                        .and_then(|v| v.as_str())
+                        .unwrap_or("")
+                        .to_string(),
+                    updated_at: data
+                        .get("updated_at")
+                        .and_then(|v| v.as_str())
+                        .unwrap_or("")
+                        .to_string(),
+                    path: path.to_string_lossy().to_string(),
+                },
+            );
         }
 
-        // Sort by updated_at descending
-        sessions.sort_by(|a, b| b.2.cmp(&a.2));
+        index
+    }
 
-        for (key, created_at, updated_at, path_str) in sessions {
-            let dict = PyDict::new(py);
-            dict.set_item("key", key)?;
-            dict.set_item("created_at", created_at)?;
-            dict.set_item("updated_at", updated_at)?;
-            dict.set_item("path", path_str)?;
-            result.append(dict)?;
+    /// Current mtime of the index sidecar, or None when it is absent.
+    fn sidecar_mtime(&self) -> Option<SystemTime> {
+        fs::metadata(self.index_path()).and_then(|m| m.modified()).ok()
+    }
+
+    /// Load the index into the cache, rebuilding it when absent or torn
+    /// and re-reading it when another process has rewritten the sidecar.
+    fn ensure_index(&self, cache: &mut IndexCache) {
+        let mtime = self.sidecar_mtime();
+        if cache.entries.is_some() && cache.mtime == mtime {
+            return;
+        }
+        let loaded = fs::read_to_string(self.index_path())
+            .ok()
+            .and_then(|s| serde_json::from_str(&s).ok());
+        match loaded {
+            Some(index) => {
+                cache.entries = Some(index);
+                cache.mtime = mtime;
+            }
+            None => {
+                let index = self.scan_index();
+                self.persist_index(&index);
+                cache.entries = Some(index);
+                cache.mtime = self.sidecar_mtime();
+            }
+        }
+    }
+
+    /// Atomically rewrite the index sidecar (write to tmp, then rename).
+    fn persist_index(&self, index: &HashMap<String, IndexEntry>) {
+        if let Ok(payload) = serde_json::to_string(index) {
+            let tmp = self.sessions_dir.join(format!("{}.tmp", INDEX_FILE));
+            if fs::write(&tmp, payload).is_ok() {
+                let _ = fs::rename(&tmp, self.index_path());
+            }
         }
+    }
 
-        Ok(result.into())
+    /// Apply a mutation to the index and persist the result.
+    fn update_index(&self, f: impl FnOnce(&mut HashMap<String, IndexEntry>)) {
+        let mut cache = self.index.lock();
+        self.ensure_index(&mut cache);
+        let index = cache.entries.as_mut().unwrap();
+        f(index);
+        self.persist_index(index);
+        cache.mtime = self.sidecar_mtime();
     }
-}
 
-impl SessionManager {
-    fn get_session_path(&self, key: &str) -> PathBuf {
-        let safe_key = safe_filename(&key.replace(":", "_"));
-        self.sessions_dir.join(format!("{}.jsonl", safe_key))
+    fn index_entry(&self, session: &Session) -> (String, IndexEntry) {
+        let path = self.get_session_path(&session.key);
+        let stem = path
+            .file_stem()
+            .and_then(|s| s.to_str())
+            .unwrap_or(&session.key)
+            .to_string();
+        (
+            stem,
+            IndexEntry {
+                key: session.key.clone(),
+                created_at: session.created_at.clone(),
+                updated_at: session.updated_at.clone(),
+                path: path.to_string_lossy().to_string(),
+            },
+        )
     }
 
     fn load(&self, key: &str) -> Result<Option<Session>, String> {
@@ -546,7 +797,7 @@ impl SessionManager {
 
         Ok(Some(Session {
             key: key.to_string(),
-            messages,
+            messages: Arc::new(messages),
             created_at: created_at.unwrap_or_else(|| now.clone()),
             updated_at: now,
             metadata,
@@ -554,6 +805,77 @@ impl SessionManager {
     }
 }
 
+/// Extract a Python list of message dicts into internal messages.
+///
+/// `default_timestamp` fills in for dicts without a `timestamp` key.
+fn extract_messages(py_msgs: &Bound<'_, PyList>, default_timestamp: &str) -> PyResult<Vec<Message>> {
+    let mut result = Vec::with_capacity(py_msgs.len());
+    for item in py_msgs.iter() {
+        let dict = item.downcast::<PyDict>()?;
+        let role: String = dict
+            .get_item("role")?
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("missing 'role'"))?
+            .extract()?;
+        let content: String = dict
+            .get_item("content")?
+            .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyKeyError, _>("missing 'content'"))?
+            .extract()?;
+        let timestamp: String = dict
+            .get_item("timestamp")?
+            .map(|v| v.extract())
+            .transpose()?
+            .unwrap_or_else(|| default_timestamp.to_string());
+
+        // Collect extra fields
+        let mut extra = HashMap::new();
+        for (k, v) in dict.iter() {
+            let key: String = k.extract()?;
+            if key != "role" && key != "content" && key != "timestamp" {
+                let value = python_to_json(v)?;
+                extra.insert(key, value);
+            }
+        }
+
+        result.push(Message {
+            role,
+            content,
+            timestamp,
+            extra,
+        });
+    }
+    Ok(result)
+}
+
+/// Serialize a session into its full JSONL payload (metadata line first).
+fn serialize_session(session: &Session) -> PyResult<String> {
+    let metadata = SessionMetadata {
+        type_marker: "metadata".to_string(),
+        created_at: session.created_at.clone(),
+        updated_at: session.updated_at.clone(),
+        metadata: session.metadata.clone(),
+    };
+    let mut payload = serde_json::to_string(&metadata).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "Failed to serialize metadata: {}",
+            e
+        ))
+    })?;
+    payload.push('\n');
+
+    for msg in session.messages.iter() {
+        let msg_json = serde_json::to_string(msg).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "Failed to serialize message: {}",
+                e
+            ))
+        })?;
+        payload.push_str(&msg_json);
+        payload.push('\n');
+    }
+
+    Ok(payload)
+}
+
 /// Convert a string to a safe filename.
 fn safe_filename(name: &str) -> String {
     let unsafe_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*'];
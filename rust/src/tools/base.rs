@@ -1,5 +1,6 @@
 //! Base tool trait and types.
 
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use std::collections::HashMap;
@@ -41,12 +42,12 @@ impl ToolSchema {
         let dict = PyDict::new(py);
         let func = PyDict::new(py);
 
-        func.set_item("name", &self.name)?;
-        func.set_item("description", &self.description)?;
-        func.set_item("parameters", self.parameters.get().bind(py))?;
+        func.set_item(intern!(py, "name"), &self.name)?;
+        func.set_item(intern!(py, "description"), &self.description)?;
+        func.set_item(intern!(py, "parameters"), self.parameters.get().bind(py))?;
 
-        dict.set_item("type", "function")?;
-        dict.set_item("function", func)?;
+        dict.set_item(intern!(py, "type"), "function")?;
+        dict.set_item(intern!(py, "function"), func)?;
 
         Ok(dict.into())
     }
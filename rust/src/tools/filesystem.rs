@@ -2,6 +2,7 @@
 
 use pyo3::prelude::*;
 use pyo3_async_runtimes::tokio::future_into_py;
+use sha2::Digest;
 use std::collections::HashMap;
 use std::path::PathBuf;
 use tokio::fs;
@@ -52,6 +53,10 @@ impl ReadFileTool {
         Tool::to_schema(self, py)
     }
 
+    /// Files at or above this size are read through an mmap instead of
+    /// a buffered read, skipping the kernel-to-userspace copy.
+    const MMAP_THRESHOLD: u64 = 64 * 1024;
+
     pub async fn execute_inner(&self, params: &HashMap<String, String>) -> String {
         let path = match params.get("path") {
             Some(p) => p,
@@ -60,17 +65,42 @@ impl ReadFileTool {
 
         let file_path = expand_path(path);
 
+        let len = match fs::metadata(&file_path).await {
+            Ok(m) => m.len(),
+            Err(e) => return Self::read_error(path, &e),
+        };
+
+        if len >= Self::MMAP_THRESHOLD {
+            let mmap_path = file_path.clone();
+            let mapped = tokio::task::spawn_blocking(move || -> std::io::Result<String> {
+                let file = std::fs::File::open(&mmap_path)?;
+                let mmap = unsafe { memmap2::MmapOptions::new().map(&file)? };
+                std::str::from_utf8(&mmap)
+                    .map(str::to_owned)
+                    .map_err(|e| std::io::Error::new(std::io::ErrorKind::InvalidData, e))
+            })
+            .await;
+
+            match mapped {
+                Ok(Ok(content)) => return content,
+                Ok(Err(e)) => return Self::read_error(path, &e),
+                Err(e) => return format!("Error reading file: {}", e),
+            }
+        }
+
         match fs::read_to_string(&file_path).await {
             Ok(content) => content,
-            Err(e) => {
-                if e.kind() == std::io::ErrorKind::NotFound {
-                    format!("Error: File not found: {}", path)
-                } else if e.kind() == std::io::ErrorKind::PermissionDenied {
-                    format!("Error: Permission denied: {}", path)
-                } else {
-                    format!("Error reading file: {}", e)
-                }
-            }
+            Err(e) => Self::read_error(path, &e),
+        }
+    }
+
+    fn read_error(path: &str, e: &std::io::Error) -> String {
+        if e.kind() == std::io::ErrorKind::NotFound {
+            format!("Error: File not found: {}", path)
+        } else if e.kind() == std::io::ErrorKind::PermissionDenied {
+            format!("Error: Permission denied: {}", path)
+        } else {
+            format!("Error reading file: {}", e)
         }
     }
 }
@@ -163,14 +193,22 @@ impl WriteFileTool {
 
         let file_path = expand_path(path);
 
-        // Create parent directories if needed
-        if let Some(parent) = file_path.parent() {
-            if let Err(e) = fs::create_dir_all(parent).await {
-                return format!("Error creating directories: {}", e);
+        // Optimistic write: the parent usually exists, so try first and
+        // only create directories after an ENOENT instead of paying an
+        // unconditional mkdir walk per write.
+        let result = match fs::write(&file_path, content).await {
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                if let Some(parent) = file_path.parent() {
+                    if let Err(e) = fs::create_dir_all(parent).await {
+                        return format!("Error creating directories: {}", e);
+                    }
+                }
+                fs::write(&file_path, content).await
             }
-        }
+            other => other,
+        };
 
-        match fs::write(&file_path, content).await {
+        match result {
             Ok(()) => format!("Successfully wrote {} bytes to {}", content.len(), path),
             Err(e) => {
                 if e.kind() == std::io::ErrorKind::PermissionDenied {
@@ -296,13 +334,19 @@ impl EditFileTool {
             }
         };
 
-        // Check if old_text exists
-        if !content.contains(old_text) {
-            return "Error: old_text not found in file. Make sure it matches exactly.".to_string();
-        }
-
-        // Count occurrences
-        let count = content.matches(old_text).count();
+        // Locate and count occurrences in one vectorized scan; the old
+        // contains + matches().count() + replacen walked the buffer
+        // three times.
+        let finder = memchr::memmem::Finder::new(old_text.as_bytes());
+        let mut matches = finder.find_iter(content.as_bytes());
+        let first = match matches.next() {
+            Some(pos) => pos,
+            None => {
+                return "Error: old_text not found in file. Make sure it matches exactly."
+                    .to_string()
+            }
+        };
+        let count = 1 + matches.count();
         if count > 1 {
             return format!(
                 "Warning: old_text appears {} times. Please provide more context to make it unique.",
@@ -310,11 +354,25 @@ impl EditFileTool {
             );
         }
 
-        // Replace and write
-        let new_content = content.replacen(old_text, new_text, 1);
-
-        match fs::write(&file_path, new_content).await {
-            Ok(()) => format!("Successfully edited {}", path),
+        // Splice the replacement into a preallocated buffer. Match
+        // offsets of a UTF-8 needle in UTF-8 text are char boundaries,
+        // so slicing here cannot panic.
+        let mut new_content =
+            String::with_capacity(content.len() - old_text.len() + new_text.len());
+        new_content.push_str(&content[..first]);
+        new_content.push_str(new_text);
+        new_content.push_str(&content[first + old_text.len()..]);
+
+        // Report size and digest of the buffer we just wrote, so callers
+        // can verify the edit without re-reading the file.
+        let digest = sha2::Sha256::digest(new_content.as_bytes());
+        let new_len = new_content.len();
+
+        match fs::write(&file_path, &new_content).await {
+            Ok(()) => format!(
+                "Successfully edited {} ({} bytes, sha256={:x})",
+                path, new_len, digest
+            ),
             Err(e) => {
                 if e.kind() == std::io::ErrorKind::PermissionDenied {
                     format!("Error: Permission denied: {}", path)
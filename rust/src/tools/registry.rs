@@ -60,6 +60,9 @@ impl ToolType {
 #[pyclass]
 pub struct ToolRegistry {
     tools: Arc<RwLock<HashMap<String, ToolType>>>,
+    // Definitions list built on first get_definitions call and handed
+    // out by reference until register/unregister invalidates it.
+    cached_defs: parking_lot::Mutex<Option<Py<PyList>>>,
 }
 
 #[pymethods]
@@ -68,6 +71,7 @@ impl ToolRegistry {
     fn new() -> Self {
         Self {
             tools: Arc::new(RwLock::new(HashMap::new())),
+            cached_defs: parking_lot::Mutex::new(None),
         }
     }
 
@@ -75,30 +79,35 @@ impl ToolRegistry {
     fn register_read_file(&self, tool: ReadFileTool) {
         let mut tools = futures::executor::block_on(self.tools.write());
         tools.insert(tool.tool_name().to_string(), ToolType::ReadFile(tool));
+        *self.cached_defs.lock() = None;
     }
 
     /// Register a WriteFileTool.
     fn register_write_file(&self, tool: WriteFileTool) {
         let mut tools = futures::executor::block_on(self.tools.write());
         tools.insert(tool.tool_name().to_string(), ToolType::WriteFile(tool));
+        *self.cached_defs.lock() = None;
     }
 
     /// Register an EditFileTool.
     fn register_edit_file(&self, tool: EditFileTool) {
         let mut tools = futures::executor::block_on(self.tools.write());
         tools.insert(tool.tool_name().to_string(), ToolType::EditFile(tool));
+        *self.cached_defs.lock() = None;
     }
 
     /// Register a ListDirTool.
     fn register_list_dir(&self, tool: ListDirTool) {
         let mut tools = futures::executor::block_on(self.tools.write());
         tools.insert(tool.tool_name().to_string(), ToolType::ListDir(tool));
+        *self.cached_defs.lock() = None;
     }
 
     /// Register an ExecTool.
     fn register_exec(&self, tool: ExecTool) {
         let mut tools = futures::executor::block_on(self.tools.write());
         tools.insert(tool.tool_name().to_string(), ToolType::Exec(tool));
+        *self.cached_defs.lock() = None;
     }
 
     /// Register any tool (generic method for Python compatibility).
@@ -130,10 +139,24 @@ impl ToolRegistry {
         Ok(())
     }
 
+    /// Copy of the registry sharing the same tool instances.
+    ///
+    /// Cheap to fork from a prebuilt registry: the tool map is copied
+    /// shallowly, so register/unregister on the clone never touches
+    /// the original.
+    fn clone_shallow(&self) -> Self {
+        let tools = futures::executor::block_on(self.tools.read()).clone();
+        Self {
+            tools: Arc::new(RwLock::new(tools)),
+            cached_defs: parking_lot::Mutex::new(None),
+        }
+    }
+
     /// Unregister a tool by name.
     fn unregister(&self, name: &str) {
         let mut tools = futures::executor::block_on(self.tools.write());
         tools.remove(name);
+        *self.cached_defs.lock() = None;
     }
 
     /// Check if a tool is registered.
@@ -149,7 +172,16 @@ impl ToolRegistry {
     }
 
     /// Get all tool definitions in OpenAI format.
+    ///
+    /// The list is built once and served from the cache until the set
+    /// of registered tools changes, so resending schemas on every LLM
+    /// turn costs a reference bump instead of a rebuild.
     fn get_definitions(&self, py: Python<'_>) -> PyResult<PyObject> {
+        let mut cached = self.cached_defs.lock();
+        if let Some(defs) = cached.as_ref() {
+            return Ok(defs.clone_ref(py).into());
+        }
+
         let tools = futures::executor::block_on(self.tools.read());
         let list = PyList::empty(py);
 
@@ -158,7 +190,9 @@ impl ToolRegistry {
             list.append(schema.to_dict(py)?)?;
         }
 
-        Ok(list.into())
+        let defs: Py<PyList> = list.unbind();
+        *cached = Some(defs.clone_ref(py));
+        Ok(defs.into())
     }
 
     /// Execute a tool by name with given parameters.
@@ -67,8 +67,7 @@ impl ExecTool {
                     }
                 }
                 PathBuf::from(s)
-            })
-            .unwrap_or_else(|| std::env::current_dir().unwrap_or_else(|_| PathBuf::from(".")));
+            });
 
         // Create shell command
         let mut cmd = if cfg!(target_os = "windows") {
@@ -81,7 +80,13 @@ impl ExecTool {
             c
         };
 
-        cmd.current_dir(&cwd);
+        // Only attach a chdir action when a working dir was requested;
+        // the child inherits our cwd anyway, and with no pre_exec hook
+        // or file actions the spawn stays on glibc's posix_spawn fast
+        // path instead of a full fork.
+        if let Some(cwd) = cwd {
+            cmd.current_dir(cwd);
+        }
         cmd.stdout(std::process::Stdio::piped());
         cmd.stderr(std::process::Stdio::piped());
 
@@ -0,0 +1,49 @@
+"""Shared fixtures for the test suite."""
+
+import os
+import secrets
+import shutil
+import tempfile
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tmp_root():
+    """Session-wide scratch directory, backed by tmpfs when available.
+
+    /dev/shm keeps test files entirely in memory, so file-heavy tests
+    skip page-cache flushes and directory journaling entirely.
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        root = os.path.join(shm, f"debot-tests-{os.getpid()}")
+        os.makedirs(root, exist_ok=True)
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+
+@pytest.fixture
+def tmp_file(tmp_root):
+    """Factory for unique file paths under ``tmp_root``.
+
+    Paths handed out by the factory are unlinked on teardown; the file
+    itself is created (or not) by the test.
+    """
+    handed_out = []
+
+    def _make(suffix: str = "") -> str:
+        path = os.path.join(tmp_root, f"{secrets.token_hex(4)}{suffix}")
+        handed_out.append(path)
+        return path
+
+    yield _make
+
+    for path in handed_out:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
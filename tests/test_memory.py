@@ -182,3 +182,21 @@ class TestPythonFallback:
         from debot.agent._memory_py import MemoryStore as PyMemoryStore
 
         assert PyMemoryStore is not None
+
+    async def test_append_today_flushes_without_read(self):
+        """Test that a small buffered note reaches disk without a read path.
+
+        Append buffering is a fallback-only detail (the Rust store writes
+        through), so this targets the Python implementation directly.
+        """
+        import asyncio
+
+        from debot.agent._memory_py import MemoryStore as PyMemoryStore
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = PyMemoryStore(Path(tmpdir))
+            store.append_today("Durable note")
+            await asyncio.sleep(store._FLUSH_DELAY * 2)
+
+            # Read the file directly; read_today() would flush and mask the bug.
+            assert "Durable note" in Path(store.get_today_file()).read_text()
@@ -1,8 +1,7 @@
 """Tests for the session module (Rust implementation)."""
 
-import os
+import secrets
 import tempfile
-import uuid
 from pathlib import Path
 
 import pytest
@@ -12,7 +11,7 @@ from debot.session import Session, SessionManager
 
 def unique_key(prefix: str = "test") -> str:
     """Generate a unique session key for testing."""
-    return f"{prefix}:{uuid.uuid4().hex[:8]}"
+    return f"{prefix}:{secrets.token_hex(4)}"
 
 
 class TestSession:
@@ -51,8 +50,8 @@ class TestSession:
     def test_get_history(self):
         """Test getting message history."""
         session = Session(key="test:channel")
-        for i in range(10):
-            session.add_message("user", f"Message {i}")
+        # One batched call instead of an FFI round trip per message
+        session.add_messages([{"role": "user", "content": f"Message {i}"} for i in range(10)])
 
         # Get all messages
         history = session.get_history(max_messages=50)
@@ -63,6 +62,18 @@ class TestSession:
         assert len(history) == 5
         assert history[0]["content"] == "Message 5"
 
+    def test_history_view(self):
+        """Test the lazy history view."""
+        session = Session(key="test:channel")
+        session.add_messages([{"role": "user", "content": f"Message {i}"} for i in range(10)])
+
+        view = session.history_view(max_messages=5)
+        assert len(view) == 5
+        assert view[0]["content"] == "Message 5"
+        assert view[-1]["content"] == "Message 9"
+        with pytest.raises(IndexError):
+            view[5]
+
     def test_get_history_format(self):
         """Test that get_history returns LLM format (only role and content)."""
         session = Session(key="test:channel")
@@ -143,6 +154,10 @@ class TestSessionManager:
         # Should have the message we added (from cache/disk)
         assert len(session2.messages) == 1
 
+        # Second lookup must be served from the in-memory cache
+        stats = manager.cache_stats()
+        assert stats["hits"] >= 1
+
     def test_save_and_load(self, manager):
         """Test saving and loading a session."""
         key = unique_key()
@@ -184,14 +199,17 @@ class TestSessionManager:
         """Test listing sessions."""
         # Create some sessions with unique keys
         # Note: key format should be channel:chat_id (no underscores to avoid conversion issues)
-        prefix = uuid.uuid4().hex[:8]
+        prefix = secrets.token_hex(4)
         created_keys = []
+        to_save = []
         for i in range(3):
             key = f"testlist{i}:{prefix}"
             created_keys.append(key)
             session = manager.get_or_create(key)
             session.add_message("user", f"Message {i}")
-            manager.save(session)
+            to_save.append(session)
+        # One batched call instead of a save per iteration
+        manager.save_many(to_save)
 
         sessions = manager.list_sessions()
 
@@ -202,6 +220,56 @@ class TestSessionManager:
             expected_key = key.replace(":", "_").replace("_", ":")  # After round-trip
             assert expected_key in all_keys, f"Expected {expected_key} in {all_keys}"
 
+    def test_index_not_clobbered_by_stale_manager(self, manager, temp_workspace):
+        """Test that one manager's saves don't erase another's index entries."""
+        key_a = unique_key("mgra")
+        session_a = manager.get_or_create(key_a)
+        session_a.add_message("user", "from A")
+        manager.save(session_a)  # caches the index in-process
+
+        # A second manager (same shared sessions dir) writes its own session.
+        other = SessionManager(temp_workspace)
+        key_b = unique_key("mgrb")
+        session_b = other.get_or_create(key_b)
+        session_b.add_message("user", "from B")
+        other.save(session_b)
+
+        # The first manager persists again; its cached index is now stale
+        # and must be re-read, not written back over B's entry.
+        session_a.add_message("user", "from A again")
+        manager.save(session_a)
+
+        keys = {s["key"] for s in manager.list_sessions()}
+        assert key_a in keys
+        assert key_b in keys
+
+        manager.delete(key_a)
+        manager.delete(key_b)
+
+    def test_list_sessions_scales(self, manager):
+        """Test that listing many sessions stays fast via the index file."""
+        import time
+
+        prefix = secrets.token_hex(4)
+        sessions = []
+        for i in range(100):
+            session = manager.get_or_create(f"scale{i}:{prefix}")
+            session.add_message("user", "hi")
+            sessions.append(session)
+        manager.save_many(sessions)
+
+        start = time.monotonic()
+        listed = manager.list_sessions()
+        elapsed = time.monotonic() - start
+
+        listed_keys = {s["key"] for s in listed}
+        assert all(s.key in listed_keys for s in sessions)
+        # One index read, not 100+ file opens; generous bound to avoid flakes
+        assert elapsed < 1.0
+
+        for s in sessions:
+            manager.delete(s.key)
+
 
 class TestPythonFallback:
     """Tests for Python fallback implementation."""
@@ -213,3 +281,29 @@ class TestPythonFallback:
 
         assert PySession is not None
         assert PySessionManager is not None
+
+    def test_compact_then_save_persists(self):
+        """Test that a compaction reaches disk even when length and tail are unchanged.
+
+        Compacting exactly one message keeps the message count and the tail
+        timestamp identical, so the fallback's append-only save path must
+        still detect the rewritten head and snapshot the file. compact()
+        exists only in the Python implementation, so target it directly.
+        """
+        from debot.session._manager_py import SessionManager as PySessionManager
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workspace = Path(tmpdir)
+            manager = PySessionManager(workspace)
+            key = unique_key()
+            session = manager.get_or_create(key)
+            session.add_messages([{"role": "user", "content": f"Message {i}"} for i in range(51)])
+            manager.save(session)
+
+            assert session.compact(keep_last=50) == 1
+            manager.save(session)
+
+            loaded = PySessionManager(workspace).get_or_create(key)
+            assert len(loaded.messages) == 51
+            assert loaded.messages[0].get("_type") == "compaction"
+            manager.delete(key)